@@ -9,7 +9,9 @@ easy maintenance and extensibility.
 from PySide6 import QtWidgets, QtCore, QtGui
 from typing import List, Dict, Any, Optional
 
-from src.views.ConfigPageAdd.MainTabStructure import TabCategory, FeatureGroup, get_tab_structure
+from src.views.ConfigPageAdd.MainTabStructure import (
+    TabCategory, FeatureGroup, get_tab_structure, ACCESS_FORM, TAB_LABELS, GROUP_LABELS,
+)
 from src.models.templates.AccessTemplate import AccessTemplate, ViolationAction, PowerInlineMode, QoSTrustState
 from src.widgets.ColorPicker import ColorPicker  # Import the existing ColorPicker
 
@@ -22,7 +24,7 @@ class AccessTemplateForm(QtWidgets.QWidget):
         self._editable_interfaces = editable_interfaces
 
         # Get tab structure specific for access ports
-        self._tab_structure = get_tab_structure("access")
+        self._tab_structure = get_tab_structure(ACCESS_FORM)
 
         # Create all widgets and build UI
         self._create_all_widgets()
@@ -447,7 +449,7 @@ class AccessTemplateForm(QtWidgets.QWidget):
 
             # Create a group box for each feature group in this category
             for group in self._tab_structure[category]:
-                group_box = QtWidgets.QGroupBox(group.value)
+                group_box = QtWidgets.QGroupBox(GROUP_LABELS[group])
                 group_layout = QtWidgets.QFormLayout(group_box)
 
                 # Add all widgets for this group to the form layout
@@ -489,7 +491,7 @@ class AccessTemplateForm(QtWidgets.QWidget):
             tab_layout.addStretch(1)
 
             # Add the tab to the tab widget
-            self.tabs.addTab(tab, category.value)
+            self.tabs.addTab(tab, TAB_LABELS[category])
 
         # Set the first tab as active
         self.tabs.setCurrentIndex(0)
@@ -613,17 +615,13 @@ class AccessTemplateForm(QtWidgets.QWidget):
         self.description_input.setText(inst.description or "")
 
         # Set color if provided - using current_color for ColorPicker
-        if hasattr(inst, 'color') and inst.color:
-            # Check if the color is a valid QColor
-            color_value = inst.color
-            if isinstance(color_value, str) and QtGui.QColor(color_value).isValid():
-                # Use the toggle_dropdown() to initialize the color picker properly
-                self.color_picker.toggle_dropdown()
-                self.color_picker.dropdown.hide()
-
-                # Set the current_color directly
-                self.color_picker.current_color = QtGui.QColor(color_value)
-                self.color_picker.update_color_ui()
+        # (no / invalid color → picker default, so a reused form never keeps the previous one)
+        color_value = getattr(inst, "color", None)
+        if not (isinstance(color_value, str) and QtGui.QColor(color_value).isValid()):
+            color_value = ColorPicker.DEFAULT_COLOR
+        # Set the current_color directly (dropdown syncs its inputs when opened)
+        self.color_picker.current_color = QtGui.QColor(color_value)
+        self.color_picker.update_color_ui()
 
         # Physical layer settings
         self.speed_combo.setCurrentText(inst.speed)
@@ -639,13 +637,10 @@ class AccessTemplateForm(QtWidgets.QWidget):
         self.lldp_receive_checkbox.setChecked(inst.lldp_receive)
         self.load_interval_input.setValue(inst.load_interval)
 
-        # Voice VLAN
-        if inst.voice_vlan_none:
-            self.voice_vlan_none_checkbox.setChecked(True)
-        elif inst.voice_vlan_dot1p:
-            self.voice_vlan_dot1p_checkbox.setChecked(True)
-        elif inst.voice_vlan:
-            self.voice_vlan_input.setValue(inst.voice_vlan)
+        # Voice VLAN – all three widgets set, 0 = off
+        self.voice_vlan_none_checkbox.setChecked(inst.voice_vlan_none)
+        self.voice_vlan_dot1p_checkbox.setChecked(not inst.voice_vlan_none and inst.voice_vlan_dot1p)
+        self.voice_vlan_input.setValue(inst.voice_vlan or 0)
 
         # Spanning Tree features
         self.spanning_tree_portfast_checkbox.setChecked(inst.spanning_tree_portfast)
@@ -655,8 +650,7 @@ class AccessTemplateForm(QtWidgets.QWidget):
         self.loop_guard_checkbox.setChecked(inst.loop_guard)
         self.root_guard_checkbox.setChecked(inst.root_guard)
 
-        if inst.spanning_tree_link_type:
-            self.spanning_tree_link_type_combo.setCurrentText(inst.spanning_tree_link_type)
+        self.spanning_tree_link_type_combo.setCurrentText(inst.spanning_tree_link_type or "default")
 
         # Port Security
         self.port_security_checkbox.setChecked(inst.port_security_enabled)
@@ -690,6 +684,12 @@ class AccessTemplateForm(QtWidgets.QWidget):
         self.authentication_periodic_checkbox.setChecked(inst.authentication_periodic)
         self.authentication_timer_input.setValue(inst.authentication_timer_reauthenticate)
 
+        # template order first, then the remaining methods in their default order
+        self.authentication_order_list.clear()
+        order = list(inst.authentication_order)
+        order += [m for m in ("dot1x", "mab", "webauth") if m not in order]
+        self.authentication_order_list.addItems(order)
+
         # DHCP/ARP security
         self.dhcp_snoop_trust_checkbox.setChecked(inst.dhcp_snoop_trust)
         self.dhcp_snoop_rate_input.setValue(inst.dhcp_snoop_rate or 0)
@@ -715,32 +715,27 @@ class AccessTemplateForm(QtWidgets.QWidget):
         else:
             self.qos_trust_combo.setCurrentText("--")
 
-        # QoS Marking
-        if inst.qos_cos_override is not None:
-            self.qos_cos_override_input.setValue(inst.qos_cos_override)
-        if inst.qos_dscp_override is not None:
-            self.qos_dscp_override_input.setValue(inst.qos_dscp_override)
+        # QoS Marking (0 = not set)
+        self.qos_cos_override_input.setValue(inst.qos_cos_override or 0)
+        self.qos_dscp_override_input.setValue(inst.qos_dscp_override or 0)
         self.priority_queue_out_checkbox.setChecked(inst.priority_queue_out)
 
         # QoS Policing/Shaping
         self.service_policy_input.setText(inst.service_policy_input or "")
         self.service_policy_output_input.setText(inst.service_policy_output or "")
-        if inst.shape_average:
-            self.shape_average_input.setValue(inst.shape_average)
-        if inst.police_rate:
-            self.police_rate_input.setValue(inst.police_rate)
-        if inst.police_burst:
-            self.police_burst_input.setValue(inst.police_burst)
+        # not set → clamped to the spin box minimum (its initial value)
+        self.shape_average_input.setValue(inst.shape_average or 0)
+        self.police_rate_input.setValue(inst.police_rate or 0)
+        self.police_burst_input.setValue(inst.police_burst or 0)
 
         # Error Recovery
         self.errdisable_timeout_input.setValue(inst.errdisable_timeout or 0)
 
-        # Check errdisable recovery causes in the list
+        # Check errdisable recovery causes in the list (and uncheck the rest)
+        causes = set(inst.errdisable_recovery_cause)
         for i in range(self.errdisable_recovery_list.count()):
             item = self.errdisable_recovery_list.item(i)
-            cause = item.text()
-            if cause in inst.errdisable_recovery_cause:
-                item.setCheckState(QtCore.Qt.Checked)
+            item.setCheckState(QtCore.Qt.Checked if item.text() in causes else QtCore.Qt.Unchecked)
 
         # Storm Control
         storm_any = any([
@@ -758,8 +753,7 @@ class AccessTemplateForm(QtWidgets.QWidget):
         self.unknown_unicast_min_input.setValue(inst.storm_control_unknown_unicast_min or 0.0)
         self.unknown_unicast_max_input.setValue(inst.storm_control_unknown_unicast_max or 0.0)
 
-        if inst.storm_control_action:
-            self.storm_control_action_combo.setCurrentText(inst.storm_control_action)
+        self.storm_control_action_combo.setCurrentText(inst.storm_control_action or "--")
 
         # UDLD
         self.udld_enable_checkbox.setChecked(inst.udld_enable)
@@ -776,8 +770,7 @@ class AccessTemplateForm(QtWidgets.QWidget):
             self.poe_inline_combo.setCurrentText(str(inst.poe_inline))
 
         self.poe_priority_combo.setCurrentText(inst.poe_priority)
-        if inst.poe_limit:
-            self.poe_limit_input.setValue(inst.poe_limit)
+        self.poe_limit_input.setValue(inst.poe_limit or 0)
 
         # Private VLAN and others
         self.private_vlan_host_checkbox.setChecked(inst.private_vlan_host)
@@ -823,9 +816,23 @@ class AccessTemplateForm(QtWidgets.QWidget):
 
     def get_instance_data(self) -> Dict[str, Any]:
         """Collect all form data into a dictionary for creating AccessTemplate instance."""
+        # widgets read by more than one entry below – query each once
+        voice_none = self.voice_vlan_none_checkbox.isChecked()
+        voice_dot1p = self.voice_vlan_dot1p_checkbox.isChecked()
+        link_type = self.spanning_tree_link_type_combo.currentText()
+        auth_order = self.get_authentication_order()
+        qos_trust = self.qos_trust_combo.currentText()
+        cos_override = self.qos_cos_override_input.value()
+        dscp_override = self.qos_dscp_override_input.value()
+        shape_average = self.shape_average_input.value()
+        police_rate = self.police_rate_input.value()
+        police_burst = self.police_burst_input.value()
+        storm_on = self.storm_control_checkbox.isChecked()
+        storm_action = self.storm_control_action_combo.currentText()
+
         data = {
             # Basic identification
-            "interfaces": [s.strip() for s in self.interfaces_input.text().split(",") if s.strip()],
+            "interfaces": [s for s in map(str.strip, self.interfaces_input.text().split(",")) if s],
             "vlan_id": self.vlan_id_input.value(),
             "description": self.description_input.text() or None,
             "color": self.color_picker.get_value(),  # Get color from picker using get_value()
@@ -845,11 +852,10 @@ class AccessTemplateForm(QtWidgets.QWidget):
             "load_interval": self.load_interval_input.value(),
 
             # Voice VLAN
-            "voice_vlan": (None if self.voice_vlan_none_checkbox.isChecked() or 
-                           self.voice_vlan_dot1p_checkbox.isChecked() else 
+            "voice_vlan": (None if voice_none or voice_dot1p else
                            self.voice_vlan_input.value() or None),
-            "voice_vlan_dot1p": self.voice_vlan_dot1p_checkbox.isChecked(),
-            "voice_vlan_none": self.voice_vlan_none_checkbox.isChecked(),
+            "voice_vlan_dot1p": voice_dot1p,
+            "voice_vlan_none": voice_none,
 
             # Spanning Tree
             "spanning_tree_portfast": self.spanning_tree_portfast_checkbox.isChecked(),
@@ -858,8 +864,7 @@ class AccessTemplateForm(QtWidgets.QWidget):
             "bpdu_filter": self.bpdu_filter_checkbox.isChecked(),
             "loop_guard": self.loop_guard_checkbox.isChecked(),
             "root_guard": self.root_guard_checkbox.isChecked(),
-            "spanning_tree_link_type": (None if self.spanning_tree_link_type_combo.currentText() == "default" else
-                                       self.spanning_tree_link_type_combo.currentText()),
+            "spanning_tree_link_type": None if link_type == "default" else link_type,
 
             # Port Security
             "port_security_enabled": self.port_security_checkbox.isChecked(),
@@ -877,8 +882,8 @@ class AccessTemplateForm(QtWidgets.QWidget):
             "authentication_open": self.authentication_open_checkbox.isChecked(),
             "authentication_periodic": self.authentication_periodic_checkbox.isChecked(),
             "authentication_timer_reauthenticate": self.authentication_timer_input.value(),
-            "authentication_order": self.get_authentication_order(),
-            "authentication_priority": self.get_authentication_order(),  # Same as order for now
+            "authentication_order": auth_order,
+            "authentication_priority": list(auth_order),  # Same as order for now (own copy)
 
             # DHCP/ARP Security
             "dhcp_snoop_trust": self.dhcp_snoop_trust_checkbox.isChecked(),
@@ -896,41 +901,33 @@ class AccessTemplateForm(QtWidgets.QWidget):
             "device_tracking": self.device_tracking_checkbox.isChecked(),
 
             # QoS Trust
-            "qos_trust": (None if self.qos_trust_combo.currentText() == "--" 
-                         else QoSTrustState(self.qos_trust_combo.currentText())),
+            "qos_trust": None if qos_trust == "--" else QoSTrustState(qos_trust),
 
             # QoS Marking
-            "qos_cos_override": self.qos_cos_override_input.value() if self.qos_cos_override_input.value() > 0 else None,
-            "qos_dscp_override": self.qos_dscp_override_input.value() if self.qos_dscp_override_input.value() > 0 else None,
+            "qos_cos_override": cos_override if cos_override > 0 else None,
+            "qos_dscp_override": dscp_override if dscp_override > 0 else None,
             "priority_queue_out": self.priority_queue_out_checkbox.isChecked(),
 
             # QoS Policing
             "service_policy_input": self.service_policy_input.text() or None,
             "service_policy_output": self.service_policy_output_input.text() or None,
-            "shape_average": self.shape_average_input.value() if self.shape_average_input.value() > 0 else None,
-            "police_rate": self.police_rate_input.value() if self.police_rate_input.value() > 0 else None,
-            "police_burst": self.police_burst_input.value() if self.police_burst_input.value() > 0 else None,
+            "shape_average": shape_average if shape_average > 0 else None,
+            "police_rate": police_rate if police_rate > 0 else None,
+            "police_burst": police_burst if police_burst > 0 else None,
 
             # Error Recovery
             "errdisable_timeout": self.errdisable_timeout_input.value() or None,
             "errdisable_recovery_cause": self.get_errdisable_recovery_causes(),
 
             # Storm Control
-            "storm_control_broadcast_min": (self.broadcast_min_input.value() 
-                                           if self.storm_control_checkbox.isChecked() else None),
-            "storm_control_broadcast_max": (self.broadcast_max_input.value() 
-                                           if self.storm_control_checkbox.isChecked() else None),
-            "storm_control_multicast_min": (self.multicast_min_input.value() 
-                                           if self.storm_control_checkbox.isChecked() else None),
-            "storm_control_multicast_max": (self.multicast_max_input.value() 
-                                           if self.storm_control_checkbox.isChecked() else None),
-            "storm_control_unknown_unicast_min": (self.unknown_unicast_min_input.value() 
-                                                 if self.storm_control_checkbox.isChecked() else None),
-            "storm_control_unknown_unicast_max": (self.unknown_unicast_max_input.value() 
-                                                 if self.storm_control_checkbox.isChecked() else None),
+            "storm_control_broadcast_min": self.broadcast_min_input.value() if storm_on else None,
+            "storm_control_broadcast_max": self.broadcast_max_input.value() if storm_on else None,
+            "storm_control_multicast_min": self.multicast_min_input.value() if storm_on else None,
+            "storm_control_multicast_max": self.multicast_max_input.value() if storm_on else None,
+            "storm_control_unknown_unicast_min": self.unknown_unicast_min_input.value() if storm_on else None,
+            "storm_control_unknown_unicast_max": self.unknown_unicast_max_input.value() if storm_on else None,
             "storm_control_unit_pps": self.storm_unit_pps.isChecked(),
-            "storm_control_action": (None if self.storm_control_action_combo.currentText() == "--" 
-                                    else self.storm_control_action_combo.currentText()),
+            "storm_control_action": None if storm_action == "--" else storm_action,
 
             # UDLD
             "udld_enable": self.udld_enable_checkbox.isChecked(),
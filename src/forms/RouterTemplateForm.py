@@ -3,6 +3,8 @@
 
 from PySide6 import QtWidgets
 
+from src.utils.ip_utils import is_route_entry, mark_field, mark_ipv4
+
 class RouterTemplateForm(QtWidgets.QWidget):
     """Form for filling RouterTemplate data."""
 
@@ -29,3 +31,14 @@ class RouterTemplateForm(QtWidgets.QWidget):
         layout.addRow("Interface Subnet Mask:", self.interface_mask_input)
         layout.addRow("Routing Protocols (comma separated):", self.routing_protocols_input)
         layout.addRow("Static Routes (destination/next-hop pairs comma separated):", self.static_routes_input)
+
+        # invalid addresses / routes are marked while typing (empty fields are fine)
+        self.interface_ip_input.textChanged.connect(lambda: mark_ipv4(self.interface_ip_input))
+        self.interface_mask_input.textChanged.connect(lambda: mark_ipv4(self.interface_mask_input))
+        self.static_routes_input.textChanged.connect(self._mark_routes)
+
+    def _mark_routes(self) -> None:
+        """Mark the static-route field while any of its entries is malformed."""
+        entries = [e for e in map(str.strip, self.static_routes_input.text().split(",")) if e]
+        mark_field(self.static_routes_input, all(map(is_route_entry, entries)),
+                   "Nieprawidłowa trasa – oczekiwano: cel[/maska]/next-hop")
@@ -15,6 +15,8 @@ from src.forms.SwitchL2TemplateForm import \
     SwitchL2TemplateForm  # Zmiana: importuj SwitchL2TemplateForm zamiast SwitchTemplateForm
 from src.models.templates.SwitchL3Template import SwitchL3Template, SwitchVirtualInterface, StaticRoute, ACLEntry, \
     RoutingProtocol
+from src.models.templates.SwitchL2Template import VLAN
+from src.utils.ip_utils import mark_ipv4
 
 
 class SwitchL3TemplateForm(SwitchL2TemplateForm):  # Zmiana: dziedzicz po SwitchL2TemplateForm
@@ -401,6 +403,9 @@ class SwitchL3TemplateForm(SwitchL2TemplateForm):  # Zmiana: dziedzicz po Switch
         delete_button.clicked.connect(lambda: self.svi_table.removeRow(
             self.svi_table.indexAt(delete_button.pos()).row()))
 
+        for edit in (ip_address, subnet_mask):
+            edit.textChanged.connect(lambda _text, e=edit: mark_ipv4(e))
+
         self.svi_table.setCellWidget(row, 0, vlan_id)
         self.svi_table.setCellWidget(row, 1, ip_address)
         self.svi_table.setCellWidget(row, 2, subnet_mask)
@@ -430,6 +435,10 @@ class SwitchL3TemplateForm(SwitchL2TemplateForm):  # Zmiana: dziedzicz po Switch
         delete_button.clicked.connect(lambda: self.static_routes_table.removeRow(
             self.static_routes_table.indexAt(delete_button.pos()).row()))
 
+        # next hop may also be an exit interface, so only prefix / mask are marked
+        for edit in (prefix, mask):
+            edit.textChanged.connect(lambda _text, e=edit: mark_ipv4(e))
+
         self.static_routes_table.setCellWidget(row, 0, prefix)
         self.static_routes_table.setCellWidget(row, 1, mask)
         self.static_routes_table.setCellWidget(row, 2, next_hop)
@@ -850,10 +859,11 @@ class SwitchL3TemplateForm(SwitchL2TemplateForm):  # Zmiana: dziedzicz po Switch
         svi_list = []
         for row in range(self.svi_table.rowCount()):
             vlan_id = self.svi_table.cellWidget(row, 0).value()
-            ip_address = self.svi_table.cellWidget(row, 1).text()
-            subnet_mask = self.svi_table.cellWidget(row, 2).text()
+            ip_address = self.svi_table.cellWidget(row, 1).text().strip()
+            subnet_mask = self.svi_table.cellWidget(row, 2).text().strip()
             description = self.svi_table.cellWidget(row, 3).text()
 
+            # malformed addresses are kept (and marked in the table by mark_ipv4)
             if vlan_id and ip_address and subnet_mask:
                 svi = SwitchVirtualInterface(
                     vlan_id=vlan_id,
@@ -869,9 +879,9 @@ class SwitchL3TemplateForm(SwitchL2TemplateForm):  # Zmiana: dziedzicz po Switch
         """Pobierz listę tras statycznych z tabeli."""
         routes = []
         for row in range(self.static_routes_table.rowCount()):
-            prefix = self.static_routes_table.cellWidget(row, 0).text()
-            mask = self.static_routes_table.cellWidget(row, 1).text()
-            next_hop = self.static_routes_table.cellWidget(row, 2).text()
+            prefix = self.static_routes_table.cellWidget(row, 0).text().strip()
+            mask = self.static_routes_table.cellWidget(row, 1).text().strip()
+            next_hop = self.static_routes_table.cellWidget(row, 2).text().strip()
             distance = self.static_routes_table.cellWidget(row, 3).value()
 
             if prefix and mask and next_hop:
@@ -1049,13 +1059,14 @@ class SwitchL3TemplateForm(SwitchL2TemplateForm):  # Zmiana: dziedzicz po Switch
 
             acl_entries=self._get_acl_entries(),
 
-            nat_inside_interfaces=[s.strip() for s in self.nat_inside_interfaces_input.text().split(",") if s.strip()],
-            nat_outside_interfaces=[s.strip() for s in self.nat_outside_interfaces_input.text().split(",") if
-                                    s.strip()],
+            nat_inside_interfaces=[s for s in map(str.strip, self.nat_inside_interfaces_input.text().split(","))
+                                   if s],
+            nat_outside_interfaces=[s for s in map(str.strip, self.nat_outside_interfaces_input.text().split(","))
+                                    if s],
             nat_pool=self._get_nat_pools(),
             nat_acl_to_pool=self._get_nat_acl_mappings(),
 
-            dhcp_excluded_addresses=[s.strip() for s in self.dhcp_excluded_input.text().split() if s.strip()],
+            dhcp_excluded_addresses=self.dhcp_excluded_input.text().split(),
             dhcp_pools=self._get_dhcp_pools(),
 
             hsrp_groups=self._get_hsrp_groups(),
@@ -1066,7 +1077,6 @@ class SwitchL3TemplateForm(SwitchL2TemplateForm):  # Zmiana: dziedzicz po Switch
 
     def _get_vlans_from_table(self):
         """Pobierz listę obiektów VLAN z tabeli."""
-        from src.models.templates.SwitchL2Template import VLAN
         vlans = []
 
         # Pobierz wiersze z tabeli VLAN
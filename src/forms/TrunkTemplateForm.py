@@ -130,7 +130,7 @@ class TrunkTemplateForm(QtWidgets.QWidget):
     # --------------------- helpers ------------------------------ #
     def _ensure_native(self):
         native = str(self.native_vlan_input.value())
-        csv = [v.strip() for v in self.allowed_vlans_input.text().split(",") if v.strip()]
+        csv = [v for v in map(str.strip, self.allowed_vlans_input.text().split(",")) if v]
         if native not in csv:
             csv.append(native)
             self.allowed_vlans_input.setText(",".join(csv))
@@ -150,13 +150,11 @@ class TrunkTemplateForm(QtWidgets.QWidget):
         self.native_vlan_input.setValue(inst.native_vlan)
         self.description_input.setText(inst.description or "")
 
-        # Set color if available
-        if hasattr(inst, 'color'):
-            # Set text to color hex value
-            self.color_picker.current_color = QtGui.QColor(inst.color)
-            self.color_picker.color_button.setText(inst.color.upper())
-            # Apply color to button
-            self.color_picker.update_color_ui()
+        # Set color if available (picker default otherwise, so a reused form never keeps the previous one)
+        color = getattr(inst, "color", None) or ColorPicker.DEFAULT_COLOR
+        self.color_picker.current_color = QtGui.QColor(color)
+        # Apply color to button (sets the hex text too)
+        self.color_picker.update_color_ui()
 
         self.pruning_checkbox.setChecked(inst.pruning_enabled)
         self.stp_guard_checkbox.setChecked(inst.spanning_tree_guard_root)
@@ -192,4 +190,4 @@ class TrunkTemplateForm(QtWidgets.QWidget):
         self.errdisable_timeout_input.setValue(inst.errdisable_timeout or 0)
 
         self.channel_group_input.setValue(inst.channel_group or 0)
-        self.channel_mode_combo.setCurrentText(inst.channel_group_mode or "--")
\ No newline at end of file
+        self.channel_mode_combo.setCurrentText(inst.channel_group_mode or "--")
@@ -6,12 +6,19 @@ class InterfaceAssignmentManager:
     def __init__(self, interfaces: list[str], default_template: str):
         # mapping: interface_name -> template_name
         self.interface_map = {iface: default_template for iface in interfaces}
+        # reverse index: template_name -> interfaces, plus port order for sorting
+        self._order = {iface: idx for idx, iface in enumerate(self.interface_map)}
+        self._by_template: dict[str, set[str]] = {default_template: set(self.interface_map)}
 
     def assign(self, interface: str, template: str) -> bool:
         """Assign interface to a new template. Returns True if changed."""
         if interface not in self.interface_map:
             return False
-        self.interface_map[interface] = template
+        previous = self.interface_map[interface]
+        if previous != template:
+            self._by_template[previous].discard(interface)
+            self._by_template.setdefault(template, set()).add(interface)
+            self.interface_map[interface] = template
         return True
 
     def get_template(self, interface: str) -> str:
@@ -20,4 +27,7 @@ class InterfaceAssignmentManager:
 
     def get_interfaces_for_template(self, template: str) -> list[str]:
         """Get list of interfaces assigned to given template."""
-        return [iface for iface, tpl in self.interface_map.items() if tpl == template]
+        assigned = self._by_template.get(template)
+        if not assigned:
+            return []
+        return sorted(assigned, key=self._order.__getitem__)
@@ -99,6 +99,8 @@ class SwitchL2Template:
     enable_lldp: bool = False
 
     # ---------------------------- 2. VLAN Configuration ----------------------- #
+    # Invariant: after construction add VLANs only through add_vlan() – mutating this list
+    # directly leaves vlan_ids (the ID set built in __post_init__) stale.
     vlans: List[VLAN] = field(default_factory=lambda: [VLAN(id=1, name="default")])
 
     # Convenience property to extract VLAN IDs for backward compatibility
@@ -228,6 +230,23 @@ class SwitchL2Template:
     errdisable_recovery_interval: int = 300
 
     # ------------------------------------------------------------------ #
+    def __post_init__(self) -> None:
+        # VLAN IDs of `vlans` as a set – O(1) membership checks (kept in sync by add_vlan)
+        self._vlan_set: Set[int] = {vlan.id for vlan in self.vlans}
+
+    @property
+    def vlan_ids(self) -> Set[int]:
+        """Return VLAN IDs as a set for O(1) membership checks (do not modify)."""
+        return self._vlan_set
+
+    def add_vlan(self, vlan_id: int, name: Optional[str] = None) -> bool:
+        """Append VLAN *vlan_id* unless it already exists; return True if added."""
+        if vlan_id in self._vlan_set:
+            return False
+        self.vlans.append(VLAN(id=vlan_id, name=name or f"VLAN{vlan_id}"))
+        self._vlan_set.add(vlan_id)
+        return True
+
     def generate_config(
         self,
         nested_templates: Optional[Sequence[object]] = None,
@@ -2,14 +2,21 @@
 """Utility helper – resolves paths to data/assets inside the project."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def _project_root() -> Path:
     """Return the project root folder (parent of 'src')."""
     return Path(__file__).resolve().parent.parent.parent
 
 
+# Resolved once at import – the project layout does not move at runtime
+_DATA_DIR = _project_root() / "src" / "data"
+
+
+@lru_cache(maxsize=None)
 def get_data_path(filename: str) -> str:
     """
     Return an absolute path to *src/data/<filename>*.
@@ -20,4 +27,4 @@ def get_data_path(filename: str) -> str:
     Returns:
         Absolute path as string.
     """
-    return str(_project_root() / "src" / "data" / filename)
+    return str(_DATA_DIR / filename)
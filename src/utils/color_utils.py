@@ -4,6 +4,8 @@ Provides functions to adjust color brightness, contrast, and other
 properties. Supports both three- and six-character HEX color strings.
 """
 
+from functools import lru_cache
+
 
 def _normalize_hex(hex_color: str) -> str:
     """Return a normalized 6-character hex string without the leading '#'.
@@ -36,8 +38,12 @@ def adjust_color(hex_color: str, offset: int = -10) -> str:
     return f"#{r_new:02X}{g_new:02X}{b_new:02X}"
 
 
+@lru_cache(maxsize=128)
 def get_contrasting_text_color(hex_color: str) -> str:
-    """Return '#FFFFFF' or '#000000' for readable text on a color."""
+    """Return '#FFFFFF' or '#000000' for readable text on a color.
+
+    Memoized – interface buttons and sidebar radios share a handful of colors.
+    """
 
     hex_color = _normalize_hex(hex_color)
 
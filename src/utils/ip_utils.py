@@ -0,0 +1,51 @@
+"""Utility functions for IPv4 address strings.
+
+Light structural checks for values typed into the L3 tables (SVI
+addresses, static routes) and the router form, plus the red frame that
+marks a field failing them.
+"""
+
+import re
+
+# dotted quad with every octet in 0-255; compiled once at import
+_IPV4_RE = re.compile(
+    r"(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])"
+)
+
+
+def is_ipv4(text: str) -> bool:
+    """Return True if *text* is a dotted-quad IPv4 address or mask (e.g. '255.255.255.0')."""
+
+    return _IPV4_RE.fullmatch(text) is not None
+
+
+def is_route_entry(text: str) -> bool:
+    """Return True for 'destination [mask] next-hop', separated by spaces or '/'.
+
+    The next hop is an address or an exit interface name (e.g. 'Gi0/1').
+    """
+    parts = text.split()
+    if len(parts) == 1:  # slash form – the interface name may itself contain '/'
+        destination, _, rest = text.partition("/")
+        mask, _, next_hop = rest.partition("/")
+        parts = [destination, mask, next_hop] if is_ipv4(mask) and next_hop else [destination, rest]
+    if not 2 <= len(parts) <= 3 or not all(map(is_ipv4, parts[:-1])):
+        return False
+    next_hop = parts[-1]
+    return is_ipv4(next_hop) or next_hop[:1].isalpha()  # address or interface name
+
+
+# frame of an input field whose text failed one of the checks above
+_INVALID_QSS = "border: 1px solid #d9534f;"
+
+
+def mark_field(edit, valid: bool, hint: str) -> None:
+    """Frame the QLineEdit *edit* red and show *hint* as tooltip while it is not *valid*."""
+    edit.setStyleSheet("" if valid else _INVALID_QSS)
+    edit.setToolTip("" if valid else hint)
+
+
+def mark_ipv4(edit) -> None:
+    """Mark the QLineEdit *edit* while its text is not a valid IPv4 address (empty is fine)."""
+    text = edit.text().strip()
+    mark_field(edit, not text or is_ipv4(text), "Nieprawidłowy adres IPv4")
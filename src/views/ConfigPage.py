@@ -2,11 +2,15 @@
 Acts as the second screen in the application flow.
 """
 
+import logging
+
 from PySide6 import QtWidgets
 
 from src.views.ConfigPageAdd.ConfigSidebar import ConfigSidebar
 from src.views.ConfigPageAdd.ConfigMainArea import ConfigMainArea
 
+logger = logging.getLogger(__name__)
+
 class ConfigPage(QtWidgets.QWidget):
     """High‑level container that combines sidebar and main area."""
 
@@ -29,15 +33,10 @@ class ConfigPage(QtWidgets.QWidget):
         root.addWidget(self.main_area, 1)
 
         self.sidebar.template_changed.connect(self.main_area.load_form_by_radio_choice)
-
-        # Load default form based on initially selected radio button
-        self.main_area.load_form_by_radio_choice("device")
+        # Default "device" form is built by ConfigMainArea.showEvent on first show
 
     def _reload_default_view(self) -> None:
-        """Handle accepting a new template."""
-        if not hasattr(self, "new_template_area"):
-            return
-
-        form_data = self.new_template_area.get_template_data()
-        print("Accepted new template:", form_data)
-        self._reload_default_view()
\ No newline at end of file
+        """Return the workspace to the form of the selected template."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Reload default view: %s", self.main_area.current_template_type)
+        self.main_area.reload_default()
@@ -16,16 +16,23 @@ Interface buttons now show correct colors immediately upon application start.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
-from dataclasses import asdict
+import logging
+import sys
+from dataclasses import fields
+from functools import cached_property, lru_cache
+from itertools import product
+from math import ceil
+from typing import Any, Dict, Iterable, List, Tuple
+from weakref import WeakValueDictionary
 
-from PySide6 import QtWidgets, QtGui
+from PySide6 import QtCore, QtWidgets, QtGui
 
 from src.models.InterfaceAssignmentManager import InterfaceAssignmentManager
 
 from src.forms.AccessTemplateForm import AccessTemplateForm
 from src.forms.RouterTemplateForm import RouterTemplateForm
 from src.forms.SwitchL2TemplateForm import SwitchL2TemplateForm
+from src.forms.SwitchL3TemplateForm import SwitchL3TemplateForm
 from src.forms.TrunkTemplateForm import TrunkTemplateForm
 
 from src.models.templates.AccessTemplate import AccessTemplate
@@ -38,30 +45,84 @@ from src.utils.color_utils import get_contrasting_text_color
 
 from src.views.ConfigPageAdd.logic.FormProcessor import build_template_instance
 from src.views.ConfigPageAdd.logic.InterfaceHandler import reassign_interface
-from src.views.ConfigPageAdd.logic.TemplateManager import generate_template_name
+from src.views.ConfigPageAdd.logic.TemplateManager import generate_template_name, intern_template
 from src.views.ConfigPageAdd.logic.Exporter import export_template
+from src.views.ConfigPageAdd.NewTemplateArea import NewTemplateArea
+
+logger = logging.getLogger(__name__)
+
+
+# forms whose load_from_instance sets every widget → one instance per class is reused
+# for all template slots; the device forms only load part of their fields and are rebuilt
+_POOLED_FORMS: Tuple[type, ...] = (AccessTemplateForm, TrunkTemplateForm)
+
+
+@lru_cache(maxsize=32)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Dataclass field names of *cls*, resolved once per template class."""
+    return tuple(f.name for f in fields(cls))
 
 
 class ConfigMainArea(QtWidgets.QWidget):
     """Central configuration workspace."""
 
+    # Interface-button QSS rules shared by all instances, keyed by (color, text_color).
+    # Buttons pick their rule through the "tplColor" dynamic property.
+    _STYLE_CACHE: Dict[Tuple[str, str], str] = {}
+
     def __init__(self,
                  parent: QtWidgets.QWidget | None,
                  device_info: Dict[str, Any] | None) -> None:
         super().__init__(parent)
         self._device_info: Dict[str, Any] = device_info or {}
+        # device facts read once – used by the init and radio-switch paths
+        self._dev_type: str = (self._device_info.get("device_type") or "router").lower()
+        self._switch_layer: str = self._device_info.get("switch_layer", "L2")
+        self._ifaces: Tuple[str, ...] = tuple(self._device_info.get("interfaces", ()))
+        # device template / form classes never change for this page → pick them once
+        if self._dev_type == "switch":
+            l3 = self._switch_layer == "L3"
+            self._device_tpl_cls = SwitchL3Template if l3 else SwitchL2Template
+            self._device_form_cls = SwitchL3TemplateForm if l3 else SwitchL2TemplateForm
+            self._device_hostname = "Switch"
+        else:
+            self._device_tpl_cls = RouterTemplate
+            self._device_form_cls = RouterTemplateForm
+            self._device_hostname = "Router"
         self.current_form: QtWidgets.QWidget | None = None
         self.current_template_type: str = "device"
         # cache of template instances keyed by radio value ("device", "vlan", custom-name)
         self.custom_templates: Dict[str, object] = {}
+        # intern pool of applied templates (see intern_template) – per page, never shared
+        self._template_pool: WeakValueDictionary[tuple, object] = WeakValueDictionary()
         self.form_container: QtWidgets.QStackedWidget
 
         # Dictionary to store interface buttons for easy access when updating colors
         self.interface_buttons: Dict[str, QtWidgets.QPushButton] = {}
 
+        # interface -> template color ("" when none); rebuilt only when marked dirty
+        self._iface_color_map: Dict[str, str] = {}
+        self._color_dirty = True
+        # form class -> reusable form widget kept in form_container (see _POOLED_FORMS)
+        self._form_pool: Dict[type, QtWidgets.QWidget] = {}
+        # device form currently in form_container – rebuilt on every switch to "device"
+        self._device_form: QtWidgets.QWidget | None = None
+        # base template name -> last suffix handed out by generate_template_name
+        self._name_counters: Dict[str, int] = {}
+        # "new template" creator, built on first use and reset afterwards
+        self._creator: NewTemplateArea | None = None
+
+        # ConfigPage's sidebar, looked up on first use (see _sidebar)
+        self._sidebar_ref: QtWidgets.QWidget | None = None
+        # template name -> color last pushed to its sidebar radio
+        self._last_radio_colors: Dict[str, str] = {}
+
+        # tplColor key -> QSS rule currently installed on the interface panel
+        self._panel_rules: Dict[str, str] = {}
+
         self.interface_manager = InterfaceAssignmentManager(
-            device_info.get("interfaces", []),
-            "vlan" if device_info.get("device_type", "router") == "switch" else "device",
+            list(self._ifaces),
+            "vlan" if self._dev_type == "switch" else "device",
         )
 
         # Initialize default templates before UI to have them ready for coloring
@@ -71,25 +132,12 @@ class ConfigMainArea(QtWidgets.QWidget):
     # --------------------------- INIT --------------------------- #
     def _init_default_templates(self) -> None:
         """Initialize default templates if needed."""
-        dev_type = self._device_info.get("device_type", "router").lower()
-        switch_layer = self._device_info.get("switch_layer", "L2")  # Nowa linia
-
-        # Initialize device template
+        # Initialize device template (Router / SwitchL2 / SwitchL3, see __init__)
         if "device" not in self.custom_templates:
-            # Sprawdź typ przełącznika (L2 vs L3)
-            if dev_type == "switch":
-                if switch_layer == "L3":
-                    # Utworzenie instancji SwitchL3Template dla przełączników L3
-                    from src.models.templates.SwitchL3Template import SwitchL3Template
-                    self.custom_templates["device"] = SwitchL3Template(hostname="Switch")
-                else:
-                    # Standardowa instancja SwitchTemplate dla przełączników L2
-                    self.custom_templates["device"] = SwitchL2Template(hostname="Switch")
-            else:
-                self.custom_templates["device"] = RouterTemplate(hostname="Router")
+            self.custom_templates["device"] = self._device_tpl_cls(hostname=self._device_hostname)
 
         # Initialize VLAN 1 template for switches with default color
-        if dev_type == "switch" and "vlan" not in self.custom_templates:
+        if self._dev_type == "switch" and "vlan" not in self.custom_templates:
             vlan_interfaces = self.interface_manager.get_interfaces_for_template("vlan")
             self.custom_templates["vlan"] = AccessTemplate(
                 interfaces=vlan_interfaces,
@@ -99,63 +147,100 @@ class ConfigMainArea(QtWidgets.QWidget):
 
     # --------------------------- UI INIT --------------------------- #
     def _init_ui(self) -> None:
-        root = QtWidgets.QVBoxLayout(self)
-        root.setContentsMargins(12, 12, 12, 12)
-
-        # row of interface buttons (if any)
-        ifaces: List[str] = self._device_info.get("interfaces", [])
-        if ifaces:
-            grid = QtWidgets.QGridLayout()
-            cols = 4
-            for idx, iface in enumerate(ifaces):
-                btn = QtWidgets.QPushButton(iface)
-                btn.clicked.connect(
-                    lambda _, n=iface: reassign_interface(
-                        self.interface_manager, n, self.current_template_type, self
-                    )
-                )
-                grid.addWidget(btn, idx // cols, idx % cols)
-                # Store the button reference for color updates
-                self.interface_buttons[iface] = btn
-            root.addLayout(grid)
-
-        # form area
-        row = QtWidgets.QHBoxLayout()
-        self.form_container = QtWidgets.QStackedWidget()
-        row.addWidget(self.form_container, 1)
-        root.addLayout(row)
-
-        # action buttons
-        self.apply_btn = QtWidgets.QPushButton("Zastosuj zmiany")
-        self.apply_btn.clicked.connect(self._apply_form_changes)
-        root.addWidget(self.apply_btn)
-
-        btn_box = QtWidgets.QHBoxLayout()
-        self.back_btn = QtWidgets.QPushButton("Wstecz")
-        self.back_btn.clicked.connect(self._on_back_clicked)
-        btn_box.addWidget(self.back_btn)
-
-        self.save_btn = QtWidgets.QPushButton("Zapisz")
-        self.save_btn.clicked.connect(self._apply_form_changes)
-        btn_box.addWidget(self.save_btn)
-
-        self.export_btn = QtWidgets.QPushButton("Exportuj")
-        self.export_btn.clicked.connect(self._on_export_clicked)
-        btn_box.addWidget(self.export_btn)
-
-        root.addLayout(btn_box)
-        root.addStretch(1)
-
-        # start with Device form
-        self.load_form_by_radio_choice("device")
-
-        # Update interface button colors immediately
-        self._update_interface_button_colors()
-
-        # Make sure sidebar radio colors are initialized
-        self._update_sidebar_radio_colors()
+        # build the whole page with painting off → one layout/paint pass at the end
+        self.setUpdatesEnabled(False)
+        try:
+            root = QtWidgets.QVBoxLayout(self)
+            root.setContentsMargins(12, 12, 12, 12)
+
+            # row of interface buttons (if any)
+            ifaces = self._ifaces
+            if ifaces:
+                # one panel owns the stylesheet of all interface buttons
+                self.iface_panel = QtWidgets.QWidget()
+                grid = QtWidgets.QGridLayout(self.iface_panel)
+                grid.setContentsMargins(0, 0, 0, 0)
+                cols = 4
+                positions = product(range(ceil(len(ifaces) / cols)), range(cols))
+                for iface, (grid_row, grid_col) in zip(ifaces, positions):
+                    btn = QtWidgets.QPushButton(iface)
+                    btn.clicked.connect(self._on_iface_clicked)
+                    grid.addWidget(btn, grid_row, grid_col)
+                    # Store the button reference for color updates
+                    self.interface_buttons[iface] = btn
+                root.addWidget(self.iface_panel)
+
+            # form area
+            row = QtWidgets.QHBoxLayout()
+            self.form_container = QtWidgets.QStackedWidget()
+            row.addWidget(self.form_container, 1)
+            root.addLayout(row)
+
+            # action buttons
+            self.apply_btn = QtWidgets.QPushButton("Zastosuj zmiany")
+            self.apply_btn.clicked.connect(self._apply_form_changes)
+            root.addWidget(self.apply_btn)
+
+            btn_box = QtWidgets.QHBoxLayout()
+            self.back_btn = QtWidgets.QPushButton("Wstecz")
+            self.back_btn.clicked.connect(self._on_back_clicked)
+            btn_box.addWidget(self.back_btn)
+
+            self.save_btn = QtWidgets.QPushButton("Zapisz")
+            self.save_btn.clicked.connect(self._apply_form_changes)
+            btn_box.addWidget(self.save_btn)
+
+            self.export_btn = QtWidgets.QPushButton("Exportuj")
+            self.export_btn.clicked.connect(self._on_export_clicked)
+            btn_box.addWidget(self.export_btn)
+
+            root.addLayout(btn_box)
+            root.addStretch(1)
+
+            # the Device form itself is built on first show (see showEvent)
+
+            # Update interface button colors immediately
+            self._update_interface_button_colors()
+
+            # Make sure sidebar radio colors are initialized
+            self._update_sidebar_radio_colors()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        """Build the initial Device form once the page is actually shown."""
+        super().showEvent(event)
+        if self.current_form is None:
+            self.load_form_by_radio_choice(self.current_template_type)
+
+    @property
+    def _sidebar(self) -> QtWidgets.QWidget | None:
+        """Sidebar of the parent ConfigPage, looked up once (reset on reparent)."""
+        sidebar = self._sidebar_ref
+        if sidebar is None:
+            sidebar = self._sidebar_ref = getattr(self.parent(), "sidebar", None)
+        return sidebar
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.Type.ParentChange:
+            self._sidebar_ref = None
+        super().changeEvent(event)
+
+    @cached_property
+    def _clipboard(self) -> QtGui.QClipboard:
+        """System clipboard, fetched once on first use."""
+        return QtWidgets.QApplication.clipboard()
+
+    # ---------------------- interface buttons ----------------------- #
+    def _on_iface_clicked(self) -> None:
+        """Shared slot of all interface buttons (button text = interface name)."""
+        change = reassign_interface(
+            self.interface_manager, self.sender().text(), self.current_template_type, self
+        )
+        if change:
+            # only the clicked interface changed template
+            self._restyle_interfaces((change[0],))
 
-    # ------------------------- navigation -------------------------- #
     def _on_back_clicked(self):
         main = self.window()
         if hasattr(main, "goto_start"):
@@ -163,44 +248,89 @@ class ConfigMainArea(QtWidgets.QWidget):
 
     def _on_export_clicked(self):
         instance = build_template_instance(self.current_form)
-        export_template(instance, self)
+        # same CLI as Apply (switch template with its nested Access/Trunk sections)
+        export_template(self._generate_cli(instance) if instance else None, self)
 
     # ------------------------- Color management --------------------- #
+    def mark_colors_dirty(self) -> None:
+        """Invalidate interface colors after a template save or (re)assignment."""
+        self._color_dirty = True
+
     def _update_interface_button_colors(self) -> None:
         """Update colors of all interface buttons based on their template assignments."""
-        for iface, btn in self.interface_buttons.items():
-            template_name = self.interface_manager.get_template(iface)
-            template_instance = self.custom_templates.get(template_name)
-
-            if template_instance and hasattr(template_instance, 'color'):
-                # Set button background color based on template color
-                color = template_instance.color
-                text_color = get_contrasting_text_color(color)
+        if not self._color_dirty:
+            return
+        self._restyle_interfaces(self.interface_buttons)
+        self._color_dirty = False
+
+    def _restyle_interfaces(self, iface_names: Iterable[str]) -> None:
+        """Resolve interface → template → color and restyle only the given buttons."""
+        changed: List[str] = []
+        for iface in iface_names:
+            template_instance = self.custom_templates.get(self.interface_manager.get_template(iface))
+            self._iface_color_map[iface] = getattr(template_instance, "color", None) or ""
+            changed.append(iface)
+
+        if not changed or not self.interface_buttons:
+            return
 
-                btn.setStyleSheet(f"""
-                    QPushButton {{
+        # --- make sure every color in use has a rule on the panel ---- #
+        style_cache = ConfigMainArea._STYLE_CACHE
+        rules_changed = False
+        for color in {self._iface_color_map[iface] for iface in changed}:
+            if not color:
+                continue
+            style_key = color.lstrip("#").lower()
+            if style_key in self._panel_rules:
+                continue
+            text_color = get_contrasting_text_color(color)
+            rule = style_cache.get((color, text_color))
+            if rule is None:
+                rule = f"""
+                    QPushButton[tplColor="{style_key}"] {{
                         background-color: {color};
                         color: {text_color};
                         border: 1px solid #555555;
                         border-radius: 3px;
                         padding: 4px;
                     }}
-                    QPushButton:hover {{
+                    QPushButton[tplColor="{style_key}"]:hover {{
                         border: 1px solid #999999;
                     }}
-                """)
-            else:
-                # Default style if no template or color
-                btn.setStyleSheet("")
+                """
+                style_cache[(color, text_color)] = rule
+            self._panel_rules[style_key] = rule
+            rules_changed = True
+
+        # one parse for the whole panel, only when a new color appeared
+        if rules_changed:
+            self.iface_panel.setStyleSheet("".join(self._panel_rules.values()))
+
+        # --- switch buttons to their rule (no per-button QSS parse) --- #
+        for iface in changed:
+            btn = self.interface_buttons.get(iface)
+            if btn is None:
+                continue
+            color = self._iface_color_map[iface]
+            # empty key → no rule matches → default style
+            style_key = color.lstrip("#").lower() if color else ""
+            if btn.property("tplColor") != style_key:
+                btn.setProperty("tplColor", style_key)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
 
     def _update_sidebar_radio_colors(self) -> None:
         """Update colors of all radio buttons in the sidebar."""
-        sidebar = getattr(self.parent(), "sidebar", None)
+        sidebar = self._sidebar
         if sidebar and hasattr(sidebar, "_radio_buttons"):
             for template_name, radio_btn in sidebar._radio_buttons.items():
                 if template_name in self.custom_templates:
                     template = self.custom_templates[template_name]
                     if hasattr(template, 'color'):
+                        # skip the QSS re-apply when the color did not change
+                        if self._last_radio_colors.get(template_name) == template.color:
+                            continue
+                        self._last_radio_colors[template_name] = template.color
                         sidebar._apply_color_to_radio(radio_btn, template.color)
 
     # ------------------------- apply/save -------------------------- #
@@ -232,45 +362,42 @@ class ConfigMainArea(QtWidgets.QWidget):
             switch = self.custom_templates.get("device")
             if isinstance(switch, SwitchL2Template):
                 # add the VLAN only if it is not yet on the list
-                if instance.vlan_id not in switch.vlan_list:
-                    switch.vlan_list.append(instance.vlan_id)
+                switch.add_vlan(instance.vlan_id, instance.description)
 
         # --- store / overwrite current template -------------------- #
-        self.custom_templates[self.current_template_type] = instance
-        print(f"[DEBUG] Saved template '{self.current_template_type}'")
-
-        # --- update interface button colors ------------------------ #
-        self._update_interface_button_colors()
+        # unchanged form → same interned object, no need to refresh colors
+        instance = intern_template(self._template_pool, self.current_template_type, instance)
+        previous = self.custom_templates.get(self.current_template_type)
+        if instance is not previous:
+            self.custom_templates[self.current_template_type] = instance
+            logger.debug("Saved template '%s'", self.current_template_type)
+
+            # --- update interface button colors -------------------- #
+            # assignments do not change on apply → restyle only this template's
+            # interfaces, and only if its color changed
+            if getattr(previous, "color", None) != getattr(instance, "color", None):
+                self._restyle_interfaces(
+                    self.interface_manager.get_interfaces_for_template(self.current_template_type)
+                )
 
-        # --- update sidebar radio colors --------------------------- #
-        self._update_sidebar_radio_colors()
+            # --- update sidebar radio colors ----------------------- #
+            self._update_sidebar_radio_colors()
 
         # --- generate CLI if supported ----------------------------- #
-        if hasattr(instance, "generate_config"):
-            # collect child templates when saving the switch
-            if isinstance(instance, SwitchL2Template):
-                access_templates = [
-                    t for k, t in self.custom_templates.items()
-                    if k != "device" and isinstance(t, AccessTemplate)
-                ]
-                trunk_templates = [
-                    t for k, t in self.custom_templates.items()
-                    if k != "device" and isinstance(t, TrunkTemplate)
-                ]
-                nested = access_templates + trunk_templates
-                cli_lines = instance.generate_config(nested)
-            else:
-                cli_lines = instance.generate_config()
-
+        cli_lines = self._generate_cli(instance)
+        if cli_lines is not None:
             cli_text = "\n".join(cli_lines)
 
-            # stdout dump
-            print("\n=== Generated CLI for template "
-                  f"'{self.current_template_type}' ===\n{cli_text}\n"
-                  "=== end CLI =====================================\n")
+            # stdout dump – written piecewise, cli_text is shared with the clipboard
+            out = sys.stdout
+            out.write("\n=== Generated CLI for template '")
+            out.write(self.current_template_type)
+            out.write("' ===\n")
+            out.write(cli_text)
+            out.write("\n=== end CLI =====================================\n\n")
 
             # clipboard copy
-            QtWidgets.QApplication.clipboard().setText(cli_text)
+            self._clipboard.setText(cli_text)
 
             # UI feedback
             QtWidgets.QMessageBox.information(
@@ -279,36 +406,62 @@ class ConfigMainArea(QtWidgets.QWidget):
                 "i wyświetlona w konsoli."
             )
 
+    def _nested_templates(self) -> List[object]:
+        """Stored AccessTemplates first, TrunkTemplates second (nested into the switch CLI)."""
+        access_templates: List[AccessTemplate] = []
+        trunk_templates: List[TrunkTemplate] = []
+        # single pass over the stored templates
+        for k, t in self.custom_templates.items():
+            if k == "device":
+                continue
+            if isinstance(t, AccessTemplate):
+                access_templates.append(t)
+            elif isinstance(t, TrunkTemplate):
+                trunk_templates.append(t)
+        return access_templates + trunk_templates
+
+    def _generate_cli(self, instance) -> List[str] | None:
+        """CLI lines of *instance* as used by Apply and Export; None without generate_config()."""
+        generate = getattr(instance, "generate_config", None)
+        if generate is None:
+            return None
+        # the switch template carries the child templates (L3 derives from L2)
+        if isinstance(instance, SwitchL2Template):
+            return generate(self._nested_templates())
+        return generate()
+
     # --------------------- new template creator -------------------- #
     def show_new_template_area(self) -> None:
-        from src.views.ConfigPageAdd.NewTemplateArea import NewTemplateArea
-
-        print("[DEBUG] Opening NewTemplateArea")
-        creator = NewTemplateArea(self)
-        self.form_container.addWidget(creator)
+        logger.debug("Opening NewTemplateArea")
+        creator = self._creator
+        if creator is None:
+            creator = self._creator = NewTemplateArea(self)
+            creator.cancel_btn.clicked.connect(self.reload_default)
+            creator.accept_btn.clicked.connect(self._on_accept_new_template)
+            self.form_container.addWidget(creator)
+        else:
+            creator.reset_fields()
         self.form_container.setCurrentWidget(creator)
         self.current_form = creator
 
-        creator.cancel_btn.clicked.connect(self._reload_default_view)
-        creator.accept_btn.clicked.connect(self._on_accept_new_template)
-
     # ---------------------------------------------------------------- #
-    def _reload_default_view(self) -> None:
-        print("[DEBUG] Reload default view")
+    def reload_default(self) -> None:
+        """Show the form of the currently selected template again."""
+        logger.debug("Reload default view")
         self.load_form_by_radio_choice(self.current_template_type)
 
     # ---------------------------------------------------------------- #
     def _on_accept_new_template(self) -> None:
         """Store new template instance and update interface map."""
-        print("[DEBUG] Accepting new template")
+        logger.debug("Accepting new template")
 
         if not hasattr(self.current_form, "get_full_template_instance"):
-            print("[ERROR] Creator missing get_full_template_instance")
+            logger.error("Creator missing get_full_template_instance")
             return
 
         instance = self.current_form.get_full_template_instance()
         if instance is None:
-            print("[ERROR] Creator returned None")
+            logger.error("Creator returned None")
             return
 
         # --- AccessTemplate VLAN duplication check ------------------ #
@@ -316,49 +469,60 @@ class ConfigMainArea(QtWidgets.QWidget):
             switch = self.custom_templates.get("device")
             if isinstance(switch, SwitchL2Template):
                 vlan_id = instance.vlan_id
-                # Używamy property vlan_list, które zwraca listę int'ów
-                vlan_list = switch.vlan_list
-                if vlan_id in vlan_list:
+                # zbiór ID zamiast listy – sprawdzenie w O(1)
+                if vlan_id in switch.vlan_ids:
                     QtWidgets.QMessageBox.warning(
                         self, "Błąd",
                         f"Nie można utworzyć AccessTemplate: VLAN {vlan_id} już istnieje."
                     )
                     return
                 # Dodajemy nowy VLAN do SwitchTemplate
-                from src.models.templates.SwitchL2Template import VLAN
-                switch.vlans.append(VLAN(id=vlan_id, name=instance.description or f"VLAN{vlan_id}"))
-                print(f"[DEBUG] Added VLAN {vlan_id} to SwitchTemplate")
+                switch.add_vlan(vlan_id, instance.description)
+                logger.debug("Added VLAN %s to SwitchTemplate", vlan_id)
 
         # --- Save template ----------------------------------------- #
-        name = generate_template_name(instance, list(self.custom_templates.keys()))
+        name = generate_template_name(instance, self.custom_templates, self._name_counters)
         self.custom_templates[name] = instance
-        print(f"[DEBUG] Added custom template '{name}' with interfaces {instance.interfaces}")
+        self.mark_colors_dirty()
+        logger.debug("Added custom template '%s' with interfaces %s", name, instance.interfaces)
 
         # --- NEW → register every interface in InterfaceAssignmentManager
         for iface in getattr(instance, "interfaces", []):
             if self.interface_manager.assign(iface, name):
-                print(f"[DEBUG] Interface {iface} mapped to template '{name}'")
+                logger.debug("Interface %s mapped to template '%s'", iface, name)
 
         # --- add radio button & auto-select ------------------------- #
-        sidebar = getattr(self.parent(), "sidebar", None)
-        if sidebar and hasattr(sidebar, "add_new_template_radio"):
-            sidebar.add_new_template_radio(name, instance.color if hasattr(instance, 'color') else None)
-            btn = sidebar._radio_buttons.get(name)
-            if btn:
-                btn.setChecked(True)
-
-        # Update interface button colors
-        self._update_interface_button_colors()
+        self.setUpdatesEnabled(False)
+        try:
+            sidebar = self._sidebar
+            if sidebar and hasattr(sidebar, "add_new_template_radio"):
+                sidebar.add_new_template_radio(name, instance.color if hasattr(instance, 'color') else None)
+                btn = sidebar._radio_buttons.get(name)
+                if btn:
+                    btn.setChecked(True)
+
+            # Update interface button colors
+            self._update_interface_button_colors()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
         # finally return to normal view
-        self._reload_default_view()
+        self.reload_default()
 
     # ---------------------- radio-switch handler -------------------- #
     def load_form_by_radio_choice(self, template_type: str) -> None:
-        print(f"[DEBUG] load_form_by_radio_choice({template_type})")
+        """
+        Show the form of *template_type* in form_container.
+
+        Access / Trunk forms (_POOLED_FORMS) are built once per class and stay parented
+        and hidden in the stack (style, font metrics and layout stay warm). On every
+        switch they are reset with ``load_from_instance(instance)``, which must set
+        every widget, so unsaved edits never survive a radio switch. The device form
+        is built fresh each time and the previous one is deleted.
+        """
+        logger.debug("load_form_by_radio_choice(%s)", template_type)
         self.current_template_type = template_type
-        dev_type = self._device_info.get("device_type", "router").lower()
-        switch_layer = self._device_info.get("switch_layer", "L2")  # Nowa linia
 
         # interfaces assigned to this template
         assigned_ifaces = self.interface_manager.get_interfaces_for_template(template_type)
@@ -370,33 +534,21 @@ class ConfigMainArea(QtWidgets.QWidget):
         if template_type == "device":
             instance = self.custom_templates.get("device")
             if instance is None:
-                # Wybierz odpowiednią klasę w zależności od typu urządzenia i warstwy
-                if dev_type == "switch":
-                    if switch_layer == "L3":
-                        from src.models.templates.SwitchL3Template import SwitchL3Template
-                        instance = SwitchL3Template(hostname="Switch")
-                    else:
-                        instance = SwitchL2Template(hostname="Switch")
-                else:
-                    instance = RouterTemplate(hostname="Router")
+                instance = self._device_tpl_cls(hostname=self._device_hostname)
                 self.custom_templates["device"] = instance
+                self.mark_colors_dirty()
 
-            # Wybierz odpowiednią klasę formularza
-            if dev_type == "switch":
-                if switch_layer == "L3" and hasattr(instance, "ip_routing"):
-                    # Użyj formularza L3 jeśli typ urządzenia to przełącznik L3
-                    from src.forms.SwitchL3TemplateForm import SwitchL3TemplateForm
-                    form_cls = SwitchL3TemplateForm
-                else:
-                    form_cls = SwitchL2TemplateForm
-            else:
-                form_cls = RouterTemplateForm
+            form_cls = self._device_form_cls
+            # formularz L3 tylko dla instancji L3 (ip_routing) – inaczej wracamy do L2
+            if form_cls is SwitchL3TemplateForm and not hasattr(instance, "ip_routing"):
+                form_cls = SwitchL2TemplateForm
 
         elif template_type == "vlan":
             instance = self.custom_templates.get("vlan")
             if instance is None:
                 instance = AccessTemplate(interfaces=assigned_ifaces)
                 self.custom_templates["vlan"] = instance
+                self.mark_colors_dirty()
             else:
                 instance.interfaces = assigned_ifaces
             form_cls = AccessTemplateForm
@@ -409,26 +561,45 @@ class ConfigMainArea(QtWidgets.QWidget):
 
         # guard
         if not instance or not form_cls:
-            print(f"[ERROR] Cannot load form for template type: {template_type}")
+            logger.error("Cannot load form for template type: %s", template_type)
             return
 
-        # build and load form
-        form_widget = form_cls()
+        # pooled forms are built once per class, everything else per switch
+        form_widget = self._form_pool.get(form_cls)
+        if form_widget is None:
+            form_widget = form_cls()
+            if form_cls in _POOLED_FORMS:
+                self._form_pool[form_cls] = form_widget
         if hasattr(form_widget, "load_from_instance"):
             form_widget.load_from_instance(instance)
 
-        # replace widget
-        if current := self.form_container.currentWidget():
-            self.form_container.removeWidget(current)
-            current.deleteLater()
-        self.form_container.addWidget(form_widget)
-        self.form_container.setCurrentWidget(form_widget)
-        self.current_form = form_widget
-
-        # Update interface button colors
-        self._update_interface_button_colors()
-
-        # debug dump
-        print("[DEBUG] Active instance data:")
-        for k, v in asdict(instance).items():
-            print(f"  {k}: {v}")
\ No newline at end of file
+        # replace widget + recolor in one batch → single repaint
+        # (may be nested inside _on_accept_new_template's batch)
+        batch = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            # pooled forms and the creator stay in the stack, the old device form goes
+            if self.form_container.indexOf(form_widget) < 0:
+                self.form_container.addWidget(form_widget)
+            self.form_container.setCurrentWidget(form_widget)
+            self.current_form = form_widget
+            stale = self._device_form
+            if stale is not None and stale is not form_widget:
+                self.form_container.removeWidget(stale)
+                stale.deleteLater()
+                self._device_form = None
+            if form_cls not in _POOLED_FORMS:
+                self._device_form = form_widget
+
+            # Update interface button colors
+            self._update_interface_button_colors()
+        finally:
+            if batch:
+                self.setUpdatesEnabled(True)
+                self.update()
+
+        # debug dump – shallow, and only when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Active instance data:")
+            for name in _field_names(type(instance)):
+                logger.debug("  %s: %r", name, getattr(instance, name))
\ No newline at end of file
@@ -6,17 +6,46 @@ Updated in 2025-05:
 * Color support for radio buttons to match template colors
 """
 
+from typing import Iterable, Tuple
+
 from PySide6 import QtWidgets, QtGui
 from PySide6.QtCore import Signal
 
 from src.utils.color_utils import get_contrasting_text_color
 
+# device type -> built-in radios as (template key, label, color)
+_SIDEBAR_RADIOS: dict[str, tuple[tuple[str, str, str | None], ...]] = {
+    "router": (("device", "Device", None),),                  # default gray
+    "switch": (("device", "Device", None),
+               ("vlan", "VLAN 1", "#4287f5")),               # VLAN 1 – default blue
+}
+
+# MainWindow found by the last sidebar, re-validated before reuse
+_MAIN_WINDOW_CACHE: QtWidgets.QWidget | None = None
+
 
 class ConfigSidebar(QtWidgets.QFrame):
     """Vertical toolbar docked on the left side of the Config page."""
 
     template_changed = Signal(str)  # Signal emitted when radio selection changes
 
+    # Radio-button QSS rule per template color, shared by all sidebars.
+    # Radios pick their rule through the "tplColor" dynamic property.
+    _QSS_TEMPLATE = """
+            QRadioButton[tplColor="{key}"] {{
+                background-color: {bg};
+                color: {fg};
+                border-radius: 3px;
+                padding: 2px;
+            }}
+            QRadioButton[tplColor="{key}"]::indicator {{
+                width: 13px;
+                height: 13px;
+                margin-left: 2px;
+            }}
+        """
+    _QSS_CACHE: dict[str, str] = {}
+
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
 
@@ -25,15 +54,27 @@ class ConfigSidebar(QtWidgets.QFrame):
         self._parent_main = self._find_main_window()
         self._device_info = getattr(self._parent_main, "selected_device", {}) if self._parent_main else {}
 
-        self._radio_buttons = {}  # Dictionary to keep track of radio buttons
+        self._show_new_template = None  # main area's show_new_template_area, bound on first click
+        # tplColor key -> QSS rule currently installed on this sidebar
+        self._color_rules: dict[str, str] = {}
 
         self._init_ui()
 
     def _find_main_window(self):
-        """Traverse up to find the MainWindow."""
+        """Traverse up to find the MainWindow (cached – there is one per app)."""
+        global _MAIN_WINDOW_CACHE
+        main = _MAIN_WINDOW_CACHE
+        if main is not None:
+            try:
+                if main.isAncestorOf(self):
+                    return main
+            except RuntimeError:  # window already destroyed
+                pass
+
         parent = self.parent()
         while parent is not None:
             if hasattr(parent, "goto_start"):
+                _MAIN_WINDOW_CACHE = parent
                 return parent
             parent = parent.parent()
         return None
@@ -50,25 +91,43 @@ class ConfigSidebar(QtWidgets.QFrame):
 
         device_type = self._device_info.get("device_type", "router").lower()
 
-        # Device radio button - default gray color
-        self.radio_device = QtWidgets.QRadioButton("Device")
-        self.radio_device.setChecked(True)
-        self.radio_device.toggled.connect(lambda checked: self._on_radio_changed("device") if checked else None)
-        self.root.addWidget(self.radio_device)
-        self._radio_buttons = {"device": self.radio_device}
-
-        if device_type == "switch":
-            # VLAN 1 radio button - default blue color
-            self.radio_vlan1 = QtWidgets.QRadioButton("VLAN 1")
-            self.radio_vlan1.toggled.connect(lambda checked: self._on_radio_changed("vlan") if checked else None)
+        # one exclusive group → one connection for every template radio
+        self._radio_group = QtWidgets.QButtonGroup(self)
+        self._radio_group.setExclusive(True)
+        self._radio_group.buttonToggled.connect(self._on_radio_toggled)
+
+        # built-in radios for this device type; the first one starts checked
+        self._radio_buttons = {}  # template key -> radio button
+        for key, label, color in _SIDEBAR_RADIOS.get(device_type, _SIDEBAR_RADIOS["router"]):
+            radio = QtWidgets.QRadioButton(label)
+            radio.setChecked(not self._radio_buttons)
+            self._register_radio(radio, key)
+            if color:
+                self._apply_color_to_radio(radio, color)
+            self.root.addWidget(radio)
+            self._radio_buttons[key] = radio
+
+        self.radio_device = self._radio_buttons["device"]
+        if "vlan" in self._radio_buttons:
+            self.radio_vlan1 = self._radio_buttons["vlan"]
+
+        # custom template radios are appended here, above the stretch
+        self._template_box = QtWidgets.QVBoxLayout()
+        self._template_box.setContentsMargins(0, 0, 0, 0)
+        self._template_box.setSpacing(self.root.spacing())
+        self.root.addLayout(self._template_box)
 
-            # Apply default color for VLAN 1 (blue)
-            self._apply_color_to_radio(self.radio_vlan1, "#4287f5")
+        self.root.addStretch(1)
 
-            self.root.addWidget(self.radio_vlan1)
-            self._radio_buttons["vlan"] = self.radio_vlan1
+    def _register_radio(self, radio: QtWidgets.QRadioButton, key: str) -> None:
+        """Tag the radio with its template key and add it to the shared group."""
+        radio.setProperty("tpl_key", key)
+        self._radio_group.addButton(radio)
 
-        self.root.addStretch(1)
+    def _on_radio_toggled(self, radio: QtWidgets.QAbstractButton, checked: bool):
+        """Single slot of the radio group – the template key is stored on the button."""
+        if checked:
+            self._on_radio_changed(radio.property("tpl_key"))
 
     def _on_radio_changed(self, selection: str):
         """Emit template_changed signal when radio button selection changes."""
@@ -76,29 +135,34 @@ class ConfigSidebar(QtWidgets.QFrame):
 
     def _on_new_template_clicked(self):
         """Handle 'New Template' button click."""
-        if hasattr(self._parent_main.page.main_area, "show_new_template_area"):
-            self._parent_main.page.main_area.show_new_template_area()
+        # bound on first click – the page (and its main area) does not exist yet in __init__
+        show = self._show_new_template
+        if show is None:
+            main_area = getattr(getattr(self._parent_main, "page", None), "main_area", None)
+            show = self._show_new_template = getattr(main_area, "show_new_template_area", None)
+        if show is not None:
+            show()
 
     def _apply_color_to_radio(self, radio_button: QtWidgets.QRadioButton, color: str) -> None:
         """Apply color styling to a radio button."""
         if not color:
             return
 
-        text_color = get_contrasting_text_color(color)
-
-        radio_button.setStyleSheet(f"""
-            QRadioButton {{
-                background-color: {color};
-                color: {text_color};
-                border-radius: 3px;
-                padding: 2px;
-            }}
-            QRadioButton::indicator {{
-                width: 13px;
-                height: 13px;
-                margin-left: 2px;
-            }}
-        """)
+        key = color.lstrip("#").lower()
+        if key not in self._color_rules:
+            rule = ConfigSidebar._QSS_CACHE.get(color)
+            if rule is None:
+                rule = ConfigSidebar._QSS_CACHE[color] = self._QSS_TEMPLATE.format(
+                    key=key, bg=color, fg=get_contrasting_text_color(color)
+                )
+            self._color_rules[key] = rule
+            # one sidebar-wide stylesheet, re-parsed only when a new color appears
+            self.setStyleSheet("".join(self._color_rules.values()))
+
+        if radio_button.property("tplColor") != key:
+            radio_button.setProperty("tplColor", key)
+            radio_button.style().unpolish(radio_button)
+            radio_button.style().polish(radio_button)
 
     def add_new_template_radio(self, name: str, color: str = None):
         """
@@ -108,12 +172,29 @@ class ConfigSidebar(QtWidgets.QFrame):
             name: Template name
             color: Template color in hex format (e.g., "#FF0000")
         """
-        radio = QtWidgets.QRadioButton(name)
-        radio.toggled.connect(lambda checked, n=name: self._on_radio_changed(n) if checked else None)
+        self.add_new_template_radios(((name, color),))
 
-        # Apply color styling if provided
-        if color:
-            self._apply_color_to_radio(radio, color)
+    def add_new_template_radios(self, items: Iterable[Tuple[str, str | None]]) -> None:
+        """
+        Add template radios in one batch (a single relayout / repaint at the end).
 
-        self.root.insertWidget(self.root.count() - 1, radio)  # Insert before the stretch
-        self._radio_buttons[name] = radio
\ No newline at end of file
+        Args:
+            items: (name, color) pairs, in display order
+        """
+        batch = self.updatesEnabled()  # may be nested inside a caller's batch
+        self.setUpdatesEnabled(False)
+        try:
+            for name, color in items:
+                radio = QtWidgets.QRadioButton(name)
+                self._register_radio(radio, name)
+
+                # Apply color styling if provided
+                if color:
+                    self._apply_color_to_radio(radio, color)
+
+                self._template_box.addWidget(radio)
+                self._radio_buttons[name] = radio
+        finally:
+            if batch:
+                self.setUpdatesEnabled(True)
+            self.updateGeometry()
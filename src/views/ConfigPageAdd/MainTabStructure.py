@@ -7,9 +7,11 @@ categories with corresponding sub-panels for all switch features.
 """
 
 from enum import Enum
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple
 
-class TabCategory(Enum):
+class TabCategory(str, Enum):
     """Main configuration categories for switches and ports."""
     BASIC = "Basic Settings"
     VLANS = "VLANs"
@@ -20,7 +22,7 @@ class TabCategory(Enum):
     ADVANCED_L2 = "Advanced L2"
     SYSTEM = "System"
 
-class FeatureGroup(Enum):
+class FeatureGroup(str, Enum):
     """Sub-groups of features within each tab category."""
     # Basic Tab Groups
     IDENTIFICATION = "Identification"
@@ -75,8 +77,28 @@ class FeatureGroup(Enum):
     POWER = "Power Management"
     MISC = "Miscellaneous"
 
+
+# Display labels resolved once – forms read these instead of .value per tab/group
+TAB_LABELS: Mapping[TabCategory, str] = MappingProxyType({cat: cat.value for cat in TabCategory})
+GROUP_LABELS: Mapping[FeatureGroup, str] = MappingProxyType({grp: grp.value for grp in FeatureGroup})
+
+
+# identical feature-group tuples are shared between the tab structures below
+_GROUP_TUPLES: Dict[Tuple[FeatureGroup, ...], Tuple[FeatureGroup, ...]] = {}
+
+
+def _intern_groups(groups: List[FeatureGroup]) -> Tuple[FeatureGroup, ...]:
+    """Return the shared tuple equal to *groups*."""
+    key = tuple(groups)
+    return _GROUP_TUPLES.setdefault(key, key)
+
+
+def _freeze_tabs(tabs: Dict[TabCategory, List[FeatureGroup]]) -> Mapping[TabCategory, Tuple[FeatureGroup, ...]]:
+    """Read-only view of a tab structure – shared by every form, so it must not change."""
+    return MappingProxyType({category: _intern_groups(groups) for category, groups in tabs.items()})
+
 # Tab structure definitions for different form types
-SWITCH_TEMPLATE_TABS: Dict[TabCategory, List[FeatureGroup]] = {
+SWITCH_TEMPLATE_TABS: Mapping[TabCategory, Tuple[FeatureGroup, ...]] = _freeze_tabs({
     TabCategory.BASIC: [
         FeatureGroup.IDENTIFICATION,
         FeatureGroup.MANAGEMENT,
@@ -121,9 +143,9 @@ SWITCH_TEMPLATE_TABS: Dict[TabCategory, List[FeatureGroup]] = {
         FeatureGroup.RADIUS_TACACS,
         FeatureGroup.POWER
     ]
-}
+})
 
-ACCESS_TEMPLATE_TABS: Dict[TabCategory, List[FeatureGroup]] = {
+ACCESS_TEMPLATE_TABS: Mapping[TabCategory, Tuple[FeatureGroup, ...]] = _freeze_tabs({
     TabCategory.BASIC: [
         FeatureGroup.IDENTIFICATION,
         FeatureGroup.PHYSICAL,
@@ -159,9 +181,9 @@ ACCESS_TEMPLATE_TABS: Dict[TabCategory, List[FeatureGroup]] = {
         FeatureGroup.POWER,
         FeatureGroup.MISC
     ]
-}
+})
 
-TRUNK_TEMPLATE_TABS: Dict[TabCategory, List[FeatureGroup]] = {
+TRUNK_TEMPLATE_TABS: Mapping[TabCategory, Tuple[FeatureGroup, ...]] = _freeze_tabs({
     TabCategory.BASIC: [
         FeatureGroup.IDENTIFICATION,
         FeatureGroup.PHYSICAL
@@ -190,23 +212,57 @@ TRUNK_TEMPLATE_TABS: Dict[TabCategory, List[FeatureGroup]] = {
     TabCategory.SYSTEM: [
         FeatureGroup.MISC
     ]
+})
+
+# Form type keys accepted by get_tab_structure (already lower-case)
+SWITCH_FORM = "switch"
+ACCESS_FORM = "access"
+TRUNK_FORM = "trunk"
+
+# form type -> tab structure, used by the helper below
+_TAB_STRUCTS: Dict[str, Mapping[TabCategory, Tuple[FeatureGroup, ...]]] = {
+    SWITCH_FORM: SWITCH_TEMPLATE_TABS,
+    ACCESS_FORM: ACCESS_TEMPLATE_TABS,
+    TRUNK_FORM: TRUNK_TEMPLATE_TABS,
 }
 
+
 # Helper function to get tab structure for a specific form type
-def get_tab_structure(form_type: str) -> Dict[TabCategory, List[FeatureGroup]]:
+@lru_cache(maxsize=8)
+def get_tab_structure(form_type: str) -> Mapping[TabCategory, Tuple[FeatureGroup, ...]]:
     """Return the tab structure for the specified form type.
 
+    Args:
+        form_type: Type of form ("switch", "access", or "trunk";
+            see SWITCH_FORM / ACCESS_FORM / TRUNK_FORM)
+
+    Returns:
+        Read-only mapping of tab categories to feature groups (shared, do not copy)
+    """
+    # exact key first – .lower() only for mixed-case callers
+    tabs = _TAB_STRUCTS.get(form_type) or _TAB_STRUCTS.get(form_type.lower())
+    if tabs is None:
+        raise ValueError(f"Unknown form type: {form_type}")
+    return tabs
+
+# form type -> every feature group shown by that form (reverse index for has_feature)
+_FEATURES_IN_FORM: Dict[str, FrozenSet[FeatureGroup]] = {
+    form_type: frozenset(group for groups in tabs.values() for group in groups)
+    for form_type, tabs in _TAB_STRUCTS.items()
+}
+
+
+def has_feature(form_type: str, group: FeatureGroup) -> bool:
+    """Return True if the form of *form_type* shows the given feature group.
+
     Args:
         form_type: Type of form ("switch", "access", or "trunk")
+        group: Feature group to look up
 
     Returns:
-        Dictionary mapping tab categories to feature groups
+        True when any tab of that form contains *group*
     """
-    if form_type.lower() == "switch":
-        return SWITCH_TEMPLATE_TABS
-    elif form_type.lower() == "access":
-        return ACCESS_TEMPLATE_TABS
-    elif form_type.lower() == "trunk":
-        return TRUNK_TEMPLATE_TABS
-    else:
-        raise ValueError(f"Unknown form type: {form_type}")
\ No newline at end of file
+    features = _FEATURES_IN_FORM.get(form_type) or _FEATURES_IN_FORM.get(form_type.lower())
+    if features is None:
+        raise ValueError(f"Unknown form type: {form_type}")
+    return group in features
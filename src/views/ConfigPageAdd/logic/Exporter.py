@@ -1,10 +1,44 @@
 #src/views/ConfigPageAdd/logic/Exporter.py
 """Handles export of current form data to external file formats."""
+from __future__ import annotations
 
-from PySide6.QtWidgets import QMessageBox
+from typing import Iterable, TextIO
 
-def export_template(instance, parent_widget):
-    """Placeholder for export functionality."""
-    QMessageBox.information(parent_widget, "Eksport", "Funkcja eksportu nie została jeszcze zaimplementowana.")
-    print("[DEBUG] Export requested for instance:")
-    print(instance)
+from PySide6.QtWidgets import QFileDialog, QMessageBox
+
+# write buffer for exported config files – one syscall per 64 KiB of CLI
+_EXPORT_BUFFER = 1 << 16
+
+
+def _write_lines(out: TextIO, lines: Iterable[str]) -> None:
+    """Stream CLI lines to *out* (no intermediate string concatenation)."""
+    out.writelines(f"{line}\n" for line in lines)
+
+
+def export_template(cli_lines: Iterable[str] | None, parent_widget, *, out: TextIO | None = None) -> None:
+    """
+    Write already generated IOS CLI line by line.
+
+    Args:
+        cli_lines: Lines from ConfigMainArea._generate_cli (same as Apply); None when the
+            template has no generate_config()
+        parent_widget: Parent for the file dialog / message boxes
+        out: Open text stream (e.g. io.StringIO); when None the user picks a file
+    """
+    if cli_lines is None:
+        QMessageBox.information(parent_widget, "Eksport", "Ten szablon nie obsługuje eksportu konfiguracji.")
+        return
+
+    if out is not None:
+        _write_lines(out, cli_lines)
+        return
+
+    path, _ = QFileDialog.getSaveFileName(
+        parent_widget, "Eksport konfiguracji", "", "Konfiguracja (*.txt *.cfg);;Wszystkie pliki (*)"
+    )
+    if not path:  # dialog cancelled
+        return
+
+    with open(path, "w", encoding="utf-8", buffering=_EXPORT_BUFFER) as fh:
+        _write_lines(fh, cli_lines)
+    QMessageBox.information(parent_widget, "Eksport", f"Zapisano konfigurację do:\n{path}")
@@ -20,7 +20,7 @@ def _append_to_new_template(parent_widget, iface: str) -> bool:
     if inner is None or not hasattr(inner, "interfaces_input"):
         return False
 
-    tokens = [t.strip() for t in inner.interfaces_input.text().split(",") if t.strip()]
+    tokens = [t for t in map(str.strip, inner.interfaces_input.text().split(",")) if t]
     if iface not in tokens:
         tokens.append(iface)
         inner.interfaces_input.setText(",".join(tokens))
@@ -32,10 +32,16 @@ def reassign_interface(interface_manager,
                        iface: str,
                        current_template_type: str,
                        parent_widget):
-    """Main dispatcher for interface button clicks."""
+    """
+    Main dispatcher for interface button clicks.
+
+    Returns:
+        (iface, old_template, new_template) when the assignment changed,
+        otherwise None.
+    """
     # branch – NewTemplateArea
     if _append_to_new_template(parent_widget, iface):
-        return
+        return None
 
     # normal branch – update InterfaceAssignmentManager
     previous_template = interface_manager.get_template(iface)
@@ -44,7 +50,7 @@ def reassign_interface(interface_manager,
             parent_widget, "Info",
             f"Interface {iface} already belongs to template '{current_template_type}'."
         )
-        return
+        return None
 
     interface_manager.assign(iface, current_template_type)
     QMessageBox.information(
@@ -55,3 +61,5 @@ def reassign_interface(interface_manager,
     # force form refresh so the read-only Interfaces field updates
     if hasattr(parent_widget, "load_form_by_radio_choice"):
         parent_widget.load_form_by_radio_choice(current_template_type)
+
+    return iface, previous_template, current_template_type
@@ -1,10 +1,23 @@
 #src/views/ConfigPageAdd/logic/TemplateManager.py
-"""Handles new template creation and naming."""
+"""Handles new template creation, naming and interning."""
+
+from __future__ import annotations
+
+from enum import Enum
+from typing import Container, MutableMapping
 
 from src.models.templates.TrunkTemplate import TrunkTemplate
 
-def generate_template_name(instance, existing_keys: list[str]) -> str:
-    """Generate a unique name for a newly created template."""
+
+def generate_template_name(instance, existing_keys: Container[str],
+                           counters: dict[str, int] | None = None) -> str:
+    """
+    Generate a unique name for a newly created template.
+
+    *counters* (base name -> last used suffix) lets the caller continue
+    numbering where the previous call stopped instead of probing
+    "X", "X (2)", "X (3)", ... from the start every time.
+    """
     if isinstance(instance, TrunkTemplate):
         vid = instance.native_vlan or (instance.allowed_vlans[0] if instance.allowed_vlans else 0)
         base_name = f"TRUNK {vid}" if vid else "TRUNK"
@@ -12,10 +25,53 @@ def generate_template_name(instance, existing_keys: list[str]) -> str:
         vid = getattr(instance, "vlan_id", None)
         base_name = f"VLAN {vid}" if vid else "Custom template"
 
-    name = base_name
-    idx = 1
+    idx = counters.get(base_name, 0) + 1 if counters is not None else 1
+    name = base_name if idx == 1 else f"{base_name} ({idx})"
     while name in existing_keys:
         idx += 1
         name = f"{base_name} ({idx})"
 
+    if counters is not None:
+        counters[base_name] = idx
     return name
+
+
+def _freeze(value):
+    """Return a hashable snapshot of a template attribute value."""
+    if isinstance(value, (str, int, float, bool, Enum)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if hasattr(value, "__dict__"):
+        return (type(value), _freeze(vars(value)))
+    return value
+
+
+def intern_template(pool: MutableMapping[tuple, object], slot: str, instance):
+    """
+    Return the already stored instance for *slot* if *instance* is equal to it.
+
+    *pool* ((slot, frozen attributes) -> instance) belongs to the caller – one
+    WeakValueDictionary per ConfigMainArea, so slot names ("device", "vlan", ...)
+    never match a template of another (possibly not yet collected) page.
+
+    Equal templates rebuilt from an unchanged form become the very same object,
+    so callers can detect "nothing changed" with an identity check. Every
+    instance attribute takes part in the key (also the ad-hoc ``color`` on
+    trunks), and the pooled object is re-checked because templates are
+    mutated in place after being stored.
+    """
+    try:
+        key = (slot, _freeze(instance))
+        pooled = pool.get(key)
+    except TypeError:  # unhashable attribute – skip interning
+        return instance
+
+    if pooled is not None and (slot, _freeze(pooled)) == key:
+        return pooled
+    pool[key] = instance
+    return instance
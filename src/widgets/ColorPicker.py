@@ -4,14 +4,63 @@ Color picker component for the user interface.
 Provides a simple color selection dropdown for templates.
 """
 
+import time
+
 from PySide6 import QtWidgets, QtCore, QtGui
 
 
+def _hue_to_rgb(h_deg):
+    """
+    Convert a pure hue (s=1, v=1) to RGB using the sector formula
+
+    Args:
+        h_deg: Hue in degrees (0-359)
+
+    Returns:
+        tuple: (r, g, b) floats in range 0-1
+    """
+    h = (h_deg % 360) / 60.0
+    x = 1.0 - abs(h % 2 - 1.0)
+    sector = int(h)
+    if sector == 0:
+        return 1.0, x, 0.0
+    if sector == 1:
+        return x, 1.0, 0.0
+    if sector == 2:
+        return 0.0, 1.0, x
+    if sector == 3:
+        return 0.0, x, 1.0
+    if sector == 4:
+        return x, 0.0, 1.0
+    return 1.0, 0.0, x
+
+
+def _hsv_to_rgb(h_deg, s, v):
+    """
+    Convert HSV to RGB (shared by canvas picking and any batch sampling)
+
+    Args:
+        h_deg: Hue in degrees (0-359)
+        s: Saturation (0-1)
+        v: Value (0-1)
+
+    Returns:
+        tuple: (r, g, b) floats in range 0-1
+    """
+    # Blend pure hue towards white (saturation), then scale by value
+    return tuple(((c - 1.0) * s + 1.0) * v for c in _hue_to_rgb(h_deg))
+
+
 class ColorPicker(QtWidgets.QWidget):
     """
     Color picker component with dropdown color selection interface.
     """
 
+    # Stylesheet templates – filled with the hex value in update_color_ui
+    _BUTTON_QSS = "background-color: {};"
+    _CIRCLE_QSS = "background-color: {}; border: 1px solid #AAAAAA; border-radius: 15px;"
+    DEFAULT_COLOR = "#4287f5"  # Default blue color
+
     def __init__(self, parent=None):
         """
         Initialize the color picker component.
@@ -21,10 +70,13 @@ class ColorPicker(QtWidgets.QWidget):
         """
         super().__init__(parent)
         self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
-        self.current_color = QtGui.QColor("#4287f5")  # Default blue color
+        self.current_color = QtGui.QColor(self.DEFAULT_COLOR)
         self.mouse_down = False
+        self._last_pick_time = 0.0  # Throttle for drag sampling
         self._dropdown_visible = False  # Track dropdown state
         self.color_mode = "RGB"  # Initialize color mode
+        self._last_ui_hex = None  # Last color applied to the stylesheets
+        self._canvas_pending = False  # Canvas update interrupted by hiding the dropdown
 
         # Create layout
         self.layout = QtWidgets.QVBoxLayout(self)
@@ -38,10 +90,37 @@ class ColorPicker(QtWidgets.QWidget):
         self.color_button.clicked.connect(self.toggle_dropdown)
         self.layout.addWidget(self.color_button)
 
+        # Dropdown is built lazily on first open (see _build_dropdown)
+        self.dropdown = None
+
+        # Canvas cache for performance
+        self.canvas_cache = {}
+
+        # Reusable pixmaps evicted from canvas_cache, keyed by (w, h)
+        self._pixmap_pool = {}
+
+        # Value (brightness) gradient masks – hue independent, keyed by (w, h)
+        self._val_mask_cache = {}
+
+        # Saturation strip – one row per hue, rebuilt only when canvas width changes
+        self._hue_strip = None
+        self._hue_strip_width = None
+
+        # Delayed update timer
+        self.update_timer = QtCore.QTimer()
+        self.update_timer.setSingleShot(True)
+        self.update_timer.timeout.connect(self.delayed_update_canvas)
+
+        # Initialize button with the default color
+        self.update_color_ui()
+
+    def _build_dropdown(self):
+        """Create the dropdown widget tree (called once, on first open)"""
         # Create dropdown color picker
         self.dropdown = QtWidgets.QFrame()
         self.dropdown.setWindowFlags(QtCore.Qt.Popup)
         self.dropdown.closeEvent = self.on_dropdown_close
+        self.dropdown.installEventFilter(self)
 
         dropdown_layout = QtWidgets.QVBoxLayout(self.dropdown)
         dropdown_layout.setContentsMargins(10, 10, 10, 10)
@@ -147,25 +226,28 @@ class ColorPicker(QtWidgets.QWidget):
         self.color_canvas = QtWidgets.QLabel()
         self.color_canvas.setMinimumSize(200, 150)
         self.color_canvas.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        self.color_canvas.setMouseTracking(True)
         self.color_canvas.setCursor(QtCore.Qt.CrossCursor)
         self.color_canvas.mousePressEvent = self.handle_canvas_click
         self.color_canvas.mouseMoveEvent = self.handle_canvas_move
         self.color_canvas.mouseReleaseEvent = self.handle_canvas_release
         dropdown_layout.addWidget(self.color_canvas, stretch=1)
 
-        # Canvas cache for performance
-        self.canvas_cache = {}
-
-        # Delayed update timer
-        self.update_timer = QtCore.QTimer()
-        self.update_timer.setSingleShot(True)
-        self.update_timer.timeout.connect(self.delayed_update_canvas)
-
-        # Initialize color values and UI
+        # Sync freshly created inputs with the current color
         self.set_rgb_inputs_from_color(self.current_color)
+        self._last_ui_hex = None  # color_circle has no style yet
         self.update_color_ui()
 
+    def eventFilter(self, obj, event):
+        """Pause the canvas timer while the dropdown is hidden, resume on show"""
+        if obj is getattr(self, "dropdown", None):
+            if event.type() == QtCore.QEvent.Hide:
+                self._canvas_pending = self.update_timer.isActive()
+                self.update_timer.stop()
+            elif event.type() == QtCore.QEvent.Show and self._canvas_pending:
+                self._canvas_pending = False
+                self.update_timer.start(50)
+        return super().eventFilter(obj, event)
+
     def on_dropdown_close(self, event):
         """Handle dropdown close event"""
         self._dropdown_visible = False
@@ -187,6 +269,9 @@ class ColorPicker(QtWidgets.QWidget):
 
     def toggle_dropdown(self):
         """Toggle the color picker dropdown visibility"""
+        if self.dropdown is None:
+            self._build_dropdown()
+
         if self._dropdown_visible:
             self.dropdown.hide()
             self._dropdown_visible = False
@@ -200,6 +285,22 @@ class ColorPicker(QtWidgets.QWidget):
         self._dropdown_visible = True
         self.delayed_update_canvas()
 
+    def _set_inputs_silent(self, r, g, b, hex_str):
+        """
+        Write RGB and HEX input values without emitting change signals
+
+        Args:
+            r, g, b: Channel values (0-255)
+            hex_str: HEX color string
+        """
+        widgets = ((self.r_input, r), (self.g_input, g), (self.b_input, b))
+        blockers = [QtCore.QSignalBlocker(w) for w, _ in widgets]
+        blockers.append(QtCore.QSignalBlocker(self.hex_input))
+        for widget, value in widgets:
+            widget.setValue(value)
+        if self.hex_input.text() != hex_str:  # nie resetuj kursora podczas wpisywania
+            self.hex_input.setText(hex_str)
+
     def set_rgb_inputs_from_color(self, color):
         """
         Set RGB input values from a color object
@@ -207,20 +308,7 @@ class ColorPicker(QtWidgets.QWidget):
         Args:
             color: QColor object
         """
-        self.r_input.blockSignals(True)
-        self.g_input.blockSignals(True)
-        self.b_input.blockSignals(True)
-        self.hex_input.blockSignals(True)
-
-        self.r_input.setValue(color.red())
-        self.g_input.setValue(color.green())
-        self.b_input.setValue(color.blue())
-        self.hex_input.setText(color.name().upper())
-
-        self.r_input.blockSignals(False)
-        self.g_input.blockSignals(False)
-        self.b_input.blockSignals(False)
-        self.hex_input.blockSignals(False)
+        self._set_inputs_silent(color.red(), color.green(), color.blue(), color.name().upper())
 
     def update_from_rgb(self):
         """Update color from RGB input values"""
@@ -230,9 +318,7 @@ class ColorPicker(QtWidgets.QWidget):
         self.current_color = QtGui.QColor(r, g, b)
 
         # Update HEX field without triggering signals
-        self.hex_input.blockSignals(True)
-        self.hex_input.setText(self.current_color.name().upper())
-        self.hex_input.blockSignals(False)
+        self._set_inputs_silent(r, g, b, self.current_color.name().upper())
 
         self.update_color_ui()
         self.queue_update()
@@ -244,18 +330,8 @@ class ColorPicker(QtWidgets.QWidget):
         if color.isValid():
             self.current_color = color
 
-            # Update RGB fields without triggering signals
-            self.r_input.blockSignals(True)
-            self.g_input.blockSignals(True)
-            self.b_input.blockSignals(True)
-
-            self.r_input.setValue(self.current_color.red())
-            self.g_input.setValue(self.current_color.green())
-            self.b_input.setValue(self.current_color.blue())
-
-            self.r_input.blockSignals(False)
-            self.g_input.blockSignals(False)
-            self.b_input.blockSignals(False)
+            # Update RGB fields without triggering signals (keep the text as typed)
+            self._set_inputs_silent(color.red(), color.green(), color.blue(), hex_value)
 
             self.update_color_ui()
             self.queue_update()
@@ -263,33 +339,52 @@ class ColorPicker(QtWidgets.QWidget):
     def update_color_ui(self):
         """Update UI elements with current color"""
         hex_value = self.current_color.name()
+        # Skip QSS re-parsing when the color did not change
+        if hex_value == self._last_ui_hex:
+            return
+        self._last_ui_hex = hex_value
+
         self.color_button.setText(hex_value.upper())
 
         # Set background color of button
-        self.color_button.setStyleSheet(f"background-color: {hex_value};")
+        self.color_button.setStyleSheet(self._BUTTON_QSS.format(hex_value))
+
+        # Dropdown not created yet – only the button is on screen
+        if self.dropdown is None:
+            return
 
         # Update color indicator
-        self.color_circle.setStyleSheet(f"""
-            background-color: {hex_value};
-            border: 1px solid #AAAAAA;
-            border-radius: 15px;
-        """)
+        self.color_circle.setStyleSheet(self._CIRCLE_QSS.format(hex_value))
 
     def queue_update(self):
         """Schedule a delayed canvas update"""
+        # Canvas is repainted on open (toggle_dropdown) – skip work while hidden
+        if not self._dropdown_visible:
+            return
         self.update_timer.stop()
         self.update_timer.start(50)  # 50ms delay
 
     def delayed_update_canvas(self):
         """Update canvas after delay"""
+        # Popup may have been unmapped by the window manager
+        if not self.dropdown.isVisible():
+            return
+
         hue = self.hue_slider.value()
 
         # Limit cache size
         if len(self.canvas_cache) > 60:
             # Remove oldest entries
             keys_to_remove = list(self.canvas_cache.keys())[:-50]  # Keep 50 most recent
+            # the label shares the data of the pixmap it shows – painting on that one would
+            # detach into a fresh buffer, so it is never pooled
+            shown_key = self.color_canvas.pixmap().cacheKey()
             for key in keys_to_remove:
-                del self.canvas_cache[key]
+                # Hand the evicted, unshared surface back to the pool (max 4 per size)
+                pool = self._pixmap_pool.setdefault(key[1], [])
+                pixmap = self.canvas_cache.pop(key)
+                if len(pool) < 4 and pixmap.cacheKey() != shown_key:
+                    pool.append(pixmap)
 
         # Check cache before generating new image
         canvas_size = (self.color_canvas.width(), self.color_canvas.height())
@@ -304,6 +399,66 @@ class ColorPicker(QtWidgets.QWidget):
         self.canvas_cache[cache_key] = pixmap
         self.color_canvas.setPixmap(pixmap)
 
+    def _get_hue_strip(self, width):
+        """
+        Return the saturation strip for the given canvas width
+
+        Row *n* of the strip holds the white → pure-hue gradient for hue *n*,
+        so switching hue only needs a sub-rect blit instead of a new gradient.
+
+        Args:
+            width: Canvas width in pixels
+
+        Returns:
+            QImage: Strip of size width × 360
+        """
+        if self._hue_strip is not None and self._hue_strip_width == width:
+            return self._hue_strip
+
+        strip = QtGui.QImage(width, 360, QtGui.QImage.Format_RGB32)
+        painter = QtGui.QPainter(strip)
+        white = QtGui.QColor(255, 255, 255)
+        for hue in range(360):
+            sat_gradient = QtGui.QLinearGradient(0, 0, width, 0)
+            sat_gradient.setColorAt(0, white)
+            sat_gradient.setColorAt(1, QtGui.QColor.fromRgbF(*_hue_to_rgb(hue)))
+            painter.fillRect(0, hue, width, 1, sat_gradient)
+        painter.end()
+
+        self._hue_strip = strip
+        self._hue_strip_width = width
+        return strip
+
+    def _get_value_mask(self, width, height):
+        """
+        Return the vertical value gradient for the given canvas size
+
+        Args:
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+
+        Returns:
+            QImage: Transparent white → opaque black mask
+        """
+        mask = self._val_mask_cache.get((width, height))
+        if mask is not None:
+            return mask
+
+        mask = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+        mask.fill(QtCore.Qt.transparent)
+        val_gradient = QtGui.QLinearGradient(0, 0, 0, height)
+        val_gradient.setColorAt(0, QtGui.QColor(255, 255, 255, 0))  # Transparent white
+        val_gradient.setColorAt(1, QtGui.QColor(0, 0, 0, 255))  # Opaque black
+        painter = QtGui.QPainter(mask)
+        painter.fillRect(0, 0, width, height, val_gradient)
+        painter.end()
+
+        # Keep only a few sizes (canvas is resized rarely)
+        if len(self._val_mask_cache) >= 4:
+            del self._val_mask_cache[next(iter(self._val_mask_cache))]
+        self._val_mask_cache[(width, height)] = mask
+        return mask
+
     def generate_color_canvas(self, hue):
         """
         Generate color selection canvas for the given hue
@@ -316,26 +471,23 @@ class ColorPicker(QtWidgets.QWidget):
         """
         canvas_width = self.color_canvas.width()
         canvas_height = self.color_canvas.height()
-        pixmap = QtGui.QPixmap(canvas_width, canvas_height)
+        pool = self._pixmap_pool.get((canvas_width, canvas_height))
+        # Pooled pixmaps are held by nobody else, so the painter draws into their buffer in place
+        pixmap = pool.pop() if pool else QtGui.QPixmap(canvas_width, canvas_height)
 
-        # Use gradients for better performance
         painter = QtGui.QPainter(pixmap)
 
-        # Saturation gradient (horizontal)
-        sat_gradient = QtGui.QLinearGradient(0, 0, canvas_width, 0)
-        sat_gradient.setColorAt(0, QtGui.QColor.fromHsvF(hue / 360.0, 0, 1))
-        sat_gradient.setColorAt(1, QtGui.QColor.fromHsvF(hue / 360.0, 1, 1))
-
-        # Fill background with saturation gradient
-        painter.fillRect(0, 0, canvas_width, canvas_height, sat_gradient)
-
-        # Value gradient (vertical)
-        val_gradient = QtGui.QLinearGradient(0, 0, 0, canvas_height)
-        val_gradient.setColorAt(0, QtGui.QColor(255, 255, 255, 0))  # Transparent white
-        val_gradient.setColorAt(1, QtGui.QColor(0, 0, 0, 255))  # Opaque black
+        # Saturation gradient (horizontal) – stretch the hue's strip row over the canvas
+        strip = self._get_hue_strip(canvas_width)
+        painter.drawImage(
+            QtCore.QRect(0, 0, canvas_width, canvas_height),
+            strip,
+            QtCore.QRect(0, hue, canvas_width, 1),
+        )
 
+        # Value gradient (vertical) – pre-rendered mask, same for every hue
         painter.setCompositionMode(QtGui.QPainter.CompositionMode_Multiply)
-        painter.fillRect(0, 0, canvas_width, canvas_height, val_gradient)
+        painter.drawImage(0, 0, self._get_value_mask(canvas_width, canvas_height))
 
         painter.end()
         return pixmap
@@ -343,16 +495,25 @@ class ColorPicker(QtWidgets.QWidget):
     def handle_canvas_click(self, event):
         """Handle mouse click on color canvas"""
         self.mouse_down = True
+        self._last_pick_time = time.monotonic()
         self.pick_color_from_canvas(event.pos())
 
     def handle_canvas_release(self, event):
         """Handle mouse release on color canvas"""
+        if self.mouse_down:
+            # Final position may have been skipped by the drag throttle
+            self.pick_color_from_canvas(event.pos())
         self.mouse_down = False
 
     def handle_canvas_move(self, event):
-        """Handle mouse move on color canvas"""
-        if self.mouse_down:
-            self.pick_color_from_canvas(event.pos())
+        """Handle mouse drag on color canvas (sampled at most every 16 ms)"""
+        if not self.mouse_down:
+            return
+        now = time.monotonic()
+        if now - self._last_pick_time < 0.016:
+            return
+        self._last_pick_time = now
+        self.pick_color_from_canvas(event.pos())
 
     def pick_color_from_canvas(self, pos):
         """
@@ -373,11 +534,7 @@ class ColorPicker(QtWidgets.QWidget):
         # Calculate HSV values
         s = x / (width - 1)
         v = 1 - y / (height - 1)
-        h = self.hue_slider.value() / 360.0
-
-        # Create color from HSV
-        color = QtGui.QColor()
-        color.setHsvF(h, s, v)
+        color = QtGui.QColor.fromRgbF(*_hsv_to_rgb(self.hue_slider.value(), s, v))
         self.current_color = color
 
         # Update inputs and UI